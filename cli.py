@@ -1,77 +1,130 @@
 """
 Main CLI entry point for Alex Persona AI Chatbot.
 
-Provides Click-based command-line interface for starting the interactive chat.
+Provides an argparse-based command-line interface for starting the interactive chat.
 """
 
+import argparse
 import asyncio
+import os
 import sys
 from pathlib import Path
 
-import click
-from dotenv import load_dotenv
+VERSION = "1.0.0"
 
-# Load environment variables
-env_path = Path(__file__).parent / ".env"
-load_dotenv(env_path)
 
-from src.cli.chat import run_chat_cli
-from src.core.config import config
+def _load_environment() -> None:
+    """Load environment variables from the project .env file, using a compiled cache."""
+    env_path = Path(__file__).parent / ".env"
+    _load_env_cached(env_path)
 
 
-@click.group()
-@click.version_option(version="1.0.0", prog_name="Alex Persona AI Chatbot")
-def cli():
-    """Alex Persona AI Chatbot - Chat with an AI version of Alex Shulga."""
-    pass
+def _load_env_cached(env_path: Path) -> None:
+    """
+    Load a .env file via a compiled .env.cache.py sidecar.
 
+    The first load parses the .env file and writes it out as plain
+    os.environ.setdefault(...) statements; subsequent startups exec the
+    compiled file directly and skip the dotenv parser entirely. The cache
+    is invalidated whenever the .env file is newer than it.
 
-@cli.command()
-@click.option(
-    '--rebuild-rag',
-    is_flag=True,
-    help='Rebuild the RAG vector store from conversation files'
-)
-@click.option(
-    '--session-id',
-    type=str,
-    help='Load a specific conversation session'
-)
-def chat(rebuild_rag: bool, session_id: str):
+    Args:
+        env_path: Path to the .env file
+    """
+    if not env_path.exists():
+        return
+
+    cache_path = env_path.with_name(".env.cache.py")
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= env_path.stat().st_mtime:
+        exec(cache_path.read_text(encoding="utf-8"), {})
+        return
+
+    from dotenv import dotenv_values
+
+    values = dotenv_values(env_path)
+    lines = ["import os\n"]
+    for key in sorted(values):
+        value = values[key]
+        if value is not None:
+            lines.append(f"os.environ.setdefault({key!r}, {value!r})\n")
+
+    source = "".join(lines)
+    try:
+        # The cache mirrors .env secrets, so keep it owner-readable only
+        fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(source)
+    except OSError:
+        pass  # Read-only filesystem; fall through and just exec in-memory
+
+    exec(source, {})
+
+
+def _setup_logging(log_level: str) -> None:
+    """
+    Configure queue-based logging so log I/O stays off the event loop.
+
+    Args:
+        log_level: Logging level name from configuration (e.g. "INFO")
+    """
+    import logging
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    root.addHandler(QueueHandler(log_queue))
+
+
+def chat(args: argparse.Namespace) -> None:
     """Start an interactive chat session with Alex Persona AI."""
     try:
+        # Import the agent stack lazily so other commands stay fast
+        _load_environment()
+        from src.cli.chat import run_chat_cli
+        from src.core.config import get_config
+
+        config = get_config()
+
+        _setup_logging(config.log_level)
+
         # Validate configuration
         config.validate_config()
 
-        click.echo("🤖 Starting Alex Persona AI Chatbot...")
+        print("🤖 Starting Alex Persona AI Chatbot...")
 
-        if rebuild_rag:
-            click.echo("🔄 Rebuilding RAG system from conversations...")
+        if args.rebuild_rag:
+            print("🔄 Rebuilding RAG system from conversations...")
 
-        if session_id:
-            click.echo(f"📂 Loading session: {session_id}")
+        if args.session_id:
+            print(f"📂 Loading session: {args.session_id}")
 
         # Run the chat CLI
         asyncio.run(run_chat_cli())
 
     except ValueError as e:
-        click.echo(f"❌ Configuration error: {e}", err=True)
-        click.echo("\n💡 Please check your .env file and ensure all required variables are set.")
-        click.echo("Run 'cp .env.example .env' and edit the .env file with your settings.")
+        print(f"❌ Configuration error: {e}", file=sys.stderr)
+        print("\n💡 Please check your .env file and ensure all required variables are set.")
+        print("Run 'cp .env.example .env' and edit the .env file with your settings.")
         sys.exit(1)
     except KeyboardInterrupt:
-        click.echo("\n👋 Chat session interrupted.")
+        print("\n👋 Chat session interrupted.")
         sys.exit(0)
     except Exception as e:
-        click.echo(f"❌ Error: {e}", err=True)
+        print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.command()
-def init():
+def init(args: argparse.Namespace) -> None:
     """Initialize the Alex Persona AI system."""
     try:
-        click.echo("🚀 Initializing Alex Persona AI system...")
+        _load_environment()
+        print("🚀 Initializing Alex Persona AI system...")
 
         # Check if .env exists, if not create from template
         env_file = Path(".env")
@@ -79,79 +132,151 @@ def init():
 
         if not env_file.exists() and env_example.exists():
             env_file.write_text(env_example.read_text())
-            click.echo("📝 Created .env file from template")
-            click.echo("⚠️  Please edit .env file with your OpenAI API key and other settings")
+            print("📝 Created .env file from template")
+            print("⚠️  Please edit .env file with your OpenAI API key and other settings")
 
         # Create data directories
-        from src.core.config import config
+        from src.core.config import get_config
+
+        config = get_config()
         config._create_directories()
 
-        click.echo("📁 Created data directories")
-        click.echo("✅ Initialization complete!")
-        click.echo("\n📌 Next steps:")
-        click.echo("1. Edit .env file with your OpenAI API key")
-        click.echo("2. Run 'python cli.py chat' to start chatting")
+        print("📁 Created data directories")
+        print("✅ Initialization complete!")
+        print("\n📌 Next steps:")
+        print("1. Edit .env file with your OpenAI API key")
+        print("2. Run 'python cli.py chat' to start chatting")
 
     except Exception as e:
-        click.echo(f"❌ Error during initialization: {e}", err=True)
+        print(f"❌ Error during initialization: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.command()
-def info():
+def info(args: argparse.Namespace) -> None:
     """Show system information and configuration."""
     try:
-        from src.core.config import config
+        _load_environment()
+        from src.core.config import get_config
+
+        config = get_config()
         from src.core.utils import load_conversation_files
 
-        click.echo("📊 Alex Persona AI System Information")
-        click.echo("=" * 40)
+        print("📊 Alex Persona AI System Information")
+        print("=" * 40)
 
         # Configuration info
-        click.echo(f"LLM Model: {config.llm_model}")
-        click.echo(f"Embedding Model: {config.embedding_model}")
-        click.echo(f"Max Conversation History: {config.max_conversation_history}")
-        click.echo(f"Vector Store Path: {config.vector_store_path}")
-        click.echo(f"Session Store Path: {config.session_store_path}")
+        print(f"LLM Model: {config.llm_model}")
+        print(f"Embedding Model: {config.embedding_model}")
+        print(f"Max Conversation History: {config.max_conversation_history}")
+        print(f"Vector Store Path: {config.vector_store_path}")
+        print(f"Session Store Path: {config.session_store_path}")
 
         # Conversation data info
         conversation_files = load_conversation_files(config.conversation_data_path)
-        click.echo(f"Conversation Files: {len(conversation_files)}")
+        print(f"Conversation Files: {len(conversation_files)}")
 
         for file_path in conversation_files:
-            click.echo(f"  - {file_path.name}")
+            print(f"  - {file_path.name}")
 
         # Vector store status
-        vector_exists = (config.vector_store_path / "index.faiss").exists()
-        click.echo(f"Vector Store: {'✅ Ready' if vector_exists else '❌ Not built'}")
-
-        # Session data
-        session_files = list(config.session_store_path.glob("*.json"))
-        click.echo(f"Saved Sessions: {len(session_files)}")
+        try:
+            os.stat(config.vector_store_path / "index.faiss")
+            vector_exists = True
+        except OSError:
+            vector_exists = False
+        print(f"Vector Store: {'✅ Ready' if vector_exists else '❌ Not built'}")
+
+        # Session data - count via scandir to avoid building Path objects;
+        # the listing-cache sidecar is not a session
+        from src.core.memory import _LISTING_CACHE_NAME
+
+        with os.scandir(config.session_store_path) as entries:
+            session_count = sum(
+                1 for entry in entries
+                if entry.name.endswith(".json")
+                and entry.name != _LISTING_CACHE_NAME
+                and entry.is_file()
+            )
+        print(f"Saved Sessions: {session_count}")
 
     except Exception as e:
-        click.echo(f"❌ Error getting system info: {e}", err=True)
+        print(f"❌ Error getting system info: {e}", file=sys.stderr)
 
 
-@cli.command()
-@click.option(
-    '--days',
-    type=int,
-    default=30,
-    help='Delete sessions older than this many days'
-)
-def cleanup(days: int):
+def cleanup(args: argparse.Namespace) -> None:
     """Clean up old conversation sessions."""
     try:
+        _load_environment()
         from src.core.memory import ConversationMemory
 
         memory = ConversationMemory()
-        deleted_count = memory.cleanup_old_sessions(days)
+        deleted_count = memory.cleanup_old_sessions(args.days)
 
-        click.echo(f"🧹 Cleaned up {deleted_count} sessions older than {days} days")
+        print(f"🧹 Cleaned up {deleted_count} sessions older than {args.days} days")
 
     except Exception as e:
-        click.echo(f"❌ Error during cleanup: {e}", err=True)
+        print(f"❌ Error during cleanup: {e}", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="alex-persona",
+        description="Alex Persona AI Chatbot - Chat with an AI version of Alex Shulga."
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"Alex Persona AI Chatbot, version {VERSION}"
+    )
+
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
+
+    chat_parser = subparsers.add_parser(
+        "chat",
+        help="Start an interactive chat session with Alex Persona AI"
+    )
+    chat_parser.add_argument(
+        "--rebuild-rag",
+        action="store_true",
+        help="Rebuild the RAG vector store from conversation files"
+    )
+    chat_parser.add_argument(
+        "--session-id",
+        type=str,
+        help="Load a specific conversation session"
+    )
+
+    subparsers.add_parser("init", help="Initialize the Alex Persona AI system")
+    subparsers.add_parser("info", help="Show system information and configuration")
+
+    cleanup_parser = subparsers.add_parser(
+        "cleanup",
+        help="Clean up old conversation sessions"
+    )
+    cleanup_parser.add_argument(
+        "--days",
+        type=int,
+        default=30,
+        help="Delete sessions older than this many days"
+    )
+
+    return parser
+
+
+COMMANDS = {
+    "chat": chat,
+    "init": init,
+    "info": info,
+    "cleanup": cleanup,
+}
+
+
+def cli() -> None:
+    """Parse arguments and dispatch to the selected command."""
+    parser = build_parser()
+    args = parser.parse_args()
+    COMMANDS[args.cmd](args)
 
 
 if __name__ == "__main__":
@@ -6,20 +6,24 @@ with nodes for context retrieval, persona analysis, and response generation.
 """
 
 import asyncio
+import logging
 from typing import Any, AsyncIterator, Dict, List, Optional
 
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from openai import AsyncOpenAI
 
-from ...core.config import config
+from ...core.config import get_config
 from ...core.memory import ConversationMemory
-from ...core.models import ConversationState, PersonaContext
+from ...core.models import (EMPTY_PERSONA_CONTEXT, ConversationState,
+                            PersonaContext)
 from ...core.rag import ConversationRAG
 from ..base_agent import AgenticWorkflow, BaseAgent
 from .prompts import AlexPersonaPrompts
 from .tools import AlexPersonaToolkit
 
+logger = logging.getLogger(__name__)
+
 
 class AlexPersonaWorkflow(AgenticWorkflow):
     """LangGraph workflow for Alex Persona conversation processing."""
@@ -92,11 +96,14 @@ class AlexPersonaWorkflow(AgenticWorkflow):
         """
         Workflow node for retrieving relevant conversation context.
 
+        Runs RAG retrieval and the conversation-history fetch concurrently,
+        since neither depends on the other's result.
+
         Args:
             state: Current conversation state
 
         Returns:
-            Updated state with retrieved context
+            Updated state with retrieved context and conversation history
         """
         try:
             # Use query from state or extract from last message
@@ -104,14 +111,18 @@ class AlexPersonaWorkflow(AgenticWorkflow):
             if not query and state.messages:
                 query = state.messages[-1].get("content", "")
 
-            # Retrieve relevant conversation chunks
-            retrieved_chunks = await self.toolkit.rag_tool.get_alex_specific_context(query, k=5)
+            # Retrieve conversation chunks and history in parallel
+            retrieved_chunks, conversation_history = await asyncio.gather(
+                self.toolkit.rag_tool.get_alex_specific_context(query, k=5),
+                asyncio.to_thread(self.toolkit.memory_tool.get_conversation_context, 10)
+            )
             state.retrieved_context = retrieved_chunks
+            state.conversation_history = conversation_history
 
             return state
 
         except Exception as e:
-            print(f"Error in retrieve_context_node: {e}")
+            logger.exception("retrieve_context_node failed")
             state.error = f"Context retrieval error: {str(e)}"
             return state
 
@@ -137,9 +148,9 @@ class AlexPersonaWorkflow(AgenticWorkflow):
             return state
 
         except Exception as e:
-            print(f"Error in analyze_persona_node: {e}")
+            logger.exception("analyze_persona_node failed")
             state.error = f"Persona analysis error: {str(e)}"
-            state.persona_analysis = PersonaContext()  # Empty context on error
+            state.persona_analysis = EMPTY_PERSONA_CONTEXT  # Shared empty context on error
             return state
 
     async def _generate_response_node(self, state: ConversationState) -> ConversationState:
@@ -153,14 +164,14 @@ class AlexPersonaWorkflow(AgenticWorkflow):
             Updated state with generated response
         """
         try:
-            # Get conversation history for context
-            conversation_history = self.toolkit.memory_tool.get_conversation_context(limit=10)
+            # Conversation history was fetched alongside RAG retrieval
+            conversation_history = state.conversation_history
 
             # Prepare response prompt
             query = state.query or (state.messages[-1].get("content", "") if state.messages else "")
             response_prompt = AlexPersonaPrompts.get_response_generation_prompt(
                 query,
-                state.persona_analysis or PersonaContext(),
+                state.persona_analysis or EMPTY_PERSONA_CONTEXT,
                 conversation_history
             )
 
@@ -171,24 +182,26 @@ class AlexPersonaWorkflow(AgenticWorkflow):
             return state
 
         except Exception as e:
-            print(f"Error in generate_response_node: {e}")
+            logger.exception("generate_response_node failed")
             error_response = AlexPersonaPrompts.get_error_response_prompt("api_error")
             state.response = error_response
             state.error = f"Response generation error: {str(e)}"
             return state
 
-    async def _call_llm(self, prompt: str) -> str:
+    async def _call_llm(self, prompt: str, token_callback: Optional[Any] = None) -> str:
         """
-        Call OpenAI LLM with the prepared prompt.
+        Call OpenAI LLM with the prepared prompt, streaming tokens.
 
         Args:
             prompt: System prompt for response generation
+            token_callback: Optional callable invoked with each token as it arrives
 
         Returns:
-            Generated response text
+            Complete generated response text
         """
         try:
-            response = await self.client.chat.completions.create(
+            config = get_config()
+            stream = await self.client.chat.completions.create(
                 model=config.llm_model,
                 messages=[
                     {"role": "system", "content": AlexPersonaPrompts.get_system_prompt()},
@@ -196,13 +209,21 @@ class AlexPersonaWorkflow(AgenticWorkflow):
                 ],
                 max_tokens=config.max_tokens_per_response,
                 temperature=0.7,
-                stream=False
+                stream=True
             )
 
-            return response.choices[0].message.content or "I apologize, but I couldn't generate a response right now."
+            tokens = []
+            async for chunk in stream:
+                token = chunk.choices[0].delta.content
+                if token:
+                    tokens.append(token)
+                    if token_callback is not None:
+                        token_callback(token)
+
+            return "".join(tokens) or "I apologize, but I couldn't generate a response right now."
 
         except Exception as e:
-            print(f"Error calling LLM: {e}")
+            logger.exception("LLM call failed")
             return AlexPersonaPrompts.get_error_response_prompt("api_error")
 
 
@@ -214,7 +235,7 @@ class AlexPersonaAgent(BaseAgent):
         super().__init__("alex_persona_agent")
 
         # Initialize core systems
-        self.openai_client = config.get_openai_client()
+        self.openai_client = get_config().get_openai_client()
         self.rag_system = ConversationRAG(self.openai_client)
         self.memory_manager = ConversationMemory()
 
@@ -235,17 +256,19 @@ class AlexPersonaAgent(BaseAgent):
         if self.initialized:
             return
 
-        print("Initializing Alex Persona agent...")
+        logger.info("Initializing Alex Persona agent...")
 
         # Initialize RAG system
         await self.rag_system.initialize(force_rebuild=force_rebuild_rag)
+        if force_rebuild_rag:
+            self.toolkit.rag_tool.invalidate_cache()
 
         # Create initial session if none exists
         if self.memory_manager.current_session is None:
             self.memory_manager.create_session()
 
         self.initialized = True
-        print("Alex Persona agent initialized successfully!")
+        logger.info("Alex Persona agent initialized successfully!")
 
     async def process(self, input_state: ConversationState) -> ConversationState:
         """
@@ -285,30 +308,32 @@ class AlexPersonaAgent(BaseAgent):
             # Prepare context for streaming response
             context = await self.toolkit.prepare_response_context(query)
 
-            # Call OpenAI with streaming
-            stream = await self.openai_client.chat.completions.create(
-                model=config.llm_model,
-                messages=[
-                    {"role": "system", "content": AlexPersonaPrompts.get_system_prompt()},
-                    {"role": "user", "content": context["response_prompt"]}
-                ],
-                max_tokens=config.max_tokens_per_response,
-                temperature=0.7,
-                stream=True
+            # Stream tokens through the shared LLM call via a queue
+            token_queue: asyncio.Queue = asyncio.Queue()
+            llm_task = asyncio.create_task(
+                self.workflow._call_llm(
+                    context["response_prompt"],
+                    token_callback=token_queue.put_nowait
+                )
             )
+            llm_task.add_done_callback(lambda _: token_queue.put_nowait(None))
 
-            # Collect full response for memory storage
-            full_response = ""
+            streamed_any = False
+            while True:
+                token = await token_queue.get()
+                if token is None:
+                    break
+                streamed_any = True
+                yield token
 
-            async for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    token = chunk.choices[0].delta.content
-                    full_response += token
-                    yield token
+            # Complete response (also surfaces error fallbacks)
+            full_response = await llm_task
+            if not streamed_any and full_response:
+                yield full_response
 
             # Store the complete interaction in memory
             await self.toolkit.validate_and_store_response(
-                query, full_response, context.get("persona_context", PersonaContext())
+                query, full_response, context.get("persona_context", EMPTY_PERSONA_CONTEXT)
             )
 
         except Exception as e:
@@ -341,7 +366,7 @@ class AlexPersonaAgent(BaseAgent):
             await self.toolkit.validate_and_store_response(
                 query,
                 result_state.response,
-                result_state.persona_analysis or PersonaContext()
+                result_state.persona_analysis or EMPTY_PERSONA_CONTEXT
             )
 
         return result_state.response or "I apologize, but I couldn't process your request right now."
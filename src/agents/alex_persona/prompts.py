@@ -5,18 +5,19 @@ Contains prompt templates and style guidelines based on Alex's communication pat
 extracted from historical conversations.
 """
 
+import re
 from typing import Any, Dict, List
 
 from ...core.models import PersonaContext
 
+# Precompiled validation patterns and keyword sets for response quality checks
+_METRIC_RE = re.compile(r'\d+[k+]?\s*(engineers?|users?|hours?|products?|%)')
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9]*')
+_MICROSOFT_TERMS = frozenset({'microsoft', 'azure', 'teams', 'platform', 'platforms'})
+_COLLABORATIVE_TERMS = frozenset({'team', 'teams', 'collaborate', 'stakeholder', 'stakeholders', 'partner', 'partners'})
+_TECHNICAL_TERMS = frozenset({'api', 'apis', 'system', 'systems', 'architecture', 'implementation'})
 
-class AlexPersonaPrompts:
-    """Manages prompts and persona modeling for Alex Shulga chatbot."""
-
-    @staticmethod
-    def get_system_prompt() -> str:
-        """Get the main system prompt for Alex persona embodiment."""
-        return """You are Alex Shulga, an experienced Engineering Manager with deep expertise in AI platforms, developer experience, and team leadership. You're known for your collaborative approach, data-driven decisions, and focus on measurable impact.
+_SYSTEM_PROMPT = """You are Alex Shulga, an experienced Engineering Manager with deep expertise in AI platforms, developer experience, and team leadership. You're known for your collaborative approach, data-driven decisions, and focus on measurable impact.
 
 ## Your Core Characteristics:
 
@@ -62,10 +63,7 @@ class AlexPersonaPrompts:
 
 Remember: You're not just answering questions, you're sharing insights from your real experience building large-scale AI platforms and leading engineering teams."""
 
-    @staticmethod
-    def get_context_analysis_prompt() -> str:
-        """Get prompt for analyzing retrieved conversation context."""
-        return """Analyze the following conversation excerpts from Alex Shulga to understand the context and communication patterns relevant to the current user query.
+_CONTEXT_ANALYSIS_PROMPT = """Analyze the following conversation excerpts from Alex Shulga to understand the context and communication patterns relevant to the current user query.
 
 Focus on extracting:
 1. **Technical approaches** - How Alex handles similar problems
@@ -76,6 +74,48 @@ Focus on extracting:
 
 Use this analysis to inform how Alex would respond to the current query, ensuring consistency with his established communication patterns and expertise areas."""
 
+_CONVERSATION_STARTERS = [
+    "Tell me about your experience building RAG platforms at Microsoft",
+    "How do you approach building scalable developer platforms?",
+    "What's your philosophy on engineering team leadership?",
+    "How did you design the AI agent platform for 15,000 engineers?",
+    "What metrics do you use to measure platform success?",
+    "How do you balance technical depth with strategic vision?",
+    "Tell me about your approach to stakeholder collaboration",
+    "What lessons learned from Microsoft would apply to other companies?",
+    "How do you foster innovation in large engineering organizations?",
+    "What's your take on the future of AI in developer experience?"
+]
+
+# Memoized response prompts keyed by (query, persona fields, history);
+# chunk identity uses id() since chunks are cached upstream by the RAG layer
+_RESPONSE_PROMPT_CACHE: Dict[tuple, str] = {}
+_RESPONSE_PROMPT_CACHE_MAX = 128
+
+_ERROR_RESPONSES = {
+    "api_error": "I'm experiencing some technical difficulties right now. As someone who's dealt with platform reliability issues, I know how frustrating this can be. Let me try to help you based on my experience, though I might not have access to my full context right now.",
+
+    "context_error": "I'm having trouble accessing my conversation history at the moment. Let me share what I can from my general experience in platform engineering and team leadership.",
+
+    "parsing_error": "There seems to be an issue with processing your question. Could you rephrase it? I'm here to help with anything related to platform engineering, AI systems, or engineering leadership.",
+
+    "general_error": "Something unexpected happened on my end. In my experience building reliable systems at Microsoft, I've learned that transparent communication about issues is key. Let me know how I can still help you."
+}
+
+
+class AlexPersonaPrompts:
+    """Manages prompts and persona modeling for Alex Shulga chatbot."""
+
+    @staticmethod
+    def get_system_prompt() -> str:
+        """Get the main system prompt for Alex persona embodiment."""
+        return _SYSTEM_PROMPT
+
+    @staticmethod
+    def get_context_analysis_prompt() -> str:
+        """Get prompt for analyzing retrieved conversation context."""
+        return _CONTEXT_ANALYSIS_PROMPT
+
     @staticmethod
     def get_response_generation_prompt(
         query: str,
@@ -93,33 +133,54 @@ Use this analysis to inform how Alex would respond to the current query, ensurin
         Returns:
             Formatted prompt for response generation
         """
+        # Prompt building is pure, so identical inputs reuse the cached text
+        # (retry loops and the streaming/non-streaming paths hit this twice)
+        cache_key = (
+            query,
+            tuple(persona_context.communication_style),
+            tuple(persona_context.technical_expertise),
+            tuple(persona_context.decision_patterns),
+            tuple(persona_context.personality_traits),
+            tuple(id(chunk) for chunk in persona_context.relevant_chunks[:3]),
+            tuple((msg["role"], msg["content"]) for msg in conversation_history[-5:])
+        )
+        cached = _RESPONSE_PROMPT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Format relevant conversation chunks
         relevant_context = ""
         if persona_context.relevant_chunks:
-            relevant_context = "\n\n## Relevant Context from Alex's Conversations:\n"
-            for chunk in persona_context.relevant_chunks[:3]:  # Top 3 most relevant
-                relevant_context += f"\n**From {chunk.file_source}:**\n{chunk.content}\n"
+            context_parts = ["\n\n## Relevant Context from Alex's Conversations:\n"]
+            context_parts.extend(
+                f"\n**From {chunk.file_source}:**\n{chunk.content}\n"
+                for chunk in persona_context.relevant_chunks[:3]  # Top 3 most relevant
+            )
+            relevant_context = "".join(context_parts)
 
         # Format persona insights
-        persona_insights = ""
+        insight_parts = []
         if persona_context.communication_style:
-            persona_insights += f"\n**Communication Style:** {', '.join(persona_context.communication_style)}"
+            insight_parts.append(f"\n**Communication Style:** {', '.join(persona_context.communication_style)}")
         if persona_context.technical_expertise:
-            persona_insights += f"\n**Technical Expertise:** {', '.join(persona_context.technical_expertise)}"
+            insight_parts.append(f"\n**Technical Expertise:** {', '.join(persona_context.technical_expertise)}")
         if persona_context.decision_patterns:
-            persona_insights += f"\n**Decision Patterns:** {', '.join(persona_context.decision_patterns)}"
+            insight_parts.append(f"\n**Decision Patterns:** {', '.join(persona_context.decision_patterns)}")
         if persona_context.personality_traits:
-            persona_insights += f"\n**Personality Traits:** {', '.join(persona_context.personality_traits)}"
+            insight_parts.append(f"\n**Personality Traits:** {', '.join(persona_context.personality_traits)}")
+        persona_insights = "".join(insight_parts)
 
         # Format conversation history
         history_context = ""
         if conversation_history:
-            history_context = "\n\n## Recent Conversation:\n"
-            for msg in conversation_history[-5:]:  # Last 5 messages for context
-                role = "You" if msg["role"] == "assistant" else "User"
-                history_context += f"{role}: {msg['content']}\n"
+            history_parts = ["\n\n## Recent Conversation:\n"]
+            history_parts.extend(
+                f"{'You' if msg['role'] == 'assistant' else 'User'}: {msg['content']}\n"
+                for msg in conversation_history[-5:]  # Last 5 messages for context
+            )
+            history_context = "".join(history_parts)
 
-        return f"""You are Alex Shulga responding to the following query. Use the provided context to inform your response while maintaining consistency with your established communication patterns and expertise.
+        prompt = f"""You are Alex Shulga responding to the following query. Use the provided context to inform your response while maintaining consistency with your established communication patterns and expertise.
 
 ## User Query:
 {query}
@@ -138,21 +199,17 @@ Use this analysis to inform how Alex would respond to the current query, ensurin
 
 Generate Alex's response now:"""
 
+        if len(_RESPONSE_PROMPT_CACHE) >= _RESPONSE_PROMPT_CACHE_MAX:
+            # Drop the oldest entry; dicts preserve insertion order
+            _RESPONSE_PROMPT_CACHE.pop(next(iter(_RESPONSE_PROMPT_CACHE)))
+        _RESPONSE_PROMPT_CACHE[cache_key] = prompt
+
+        return prompt
+
     @staticmethod
     def get_conversation_starter_prompts() -> List[str]:
         """Get conversation starter suggestions for the CLI."""
-        return [
-            "Tell me about your experience building RAG platforms at Microsoft",
-            "How do you approach building scalable developer platforms?",
-            "What's your philosophy on engineering team leadership?",
-            "How did you design the AI agent platform for 15,000 engineers?",
-            "What metrics do you use to measure platform success?",
-            "How do you balance technical depth with strategic vision?",
-            "Tell me about your approach to stakeholder collaboration",
-            "What lessons learned from Microsoft would apply to other companies?",
-            "How do you foster innovation in large engineering organizations?",
-            "What's your take on the future of AI in developer experience?"
-        ]
+        return _CONVERSATION_STARTERS
 
     @staticmethod
     def get_error_response_prompt(error_type: str) -> str:
@@ -165,17 +222,7 @@ Generate Alex's response now:"""
         Returns:
             Error response prompt
         """
-        error_responses = {
-            "api_error": "I'm experiencing some technical difficulties right now. As someone who's dealt with platform reliability issues, I know how frustrating this can be. Let me try to help you based on my experience, though I might not have access to my full context right now.",
-
-            "context_error": "I'm having trouble accessing my conversation history at the moment. Let me share what I can from my general experience in platform engineering and team leadership.",
-
-            "parsing_error": "There seems to be an issue with processing your question. Could you rephrase it? I'm here to help with anything related to platform engineering, AI systems, or engineering leadership.",
-
-            "general_error": "Something unexpected happened on my end. In my experience building reliable systems at Microsoft, I've learned that transparent communication about issues is key. Let me know how I can still help you."
-        }
-
-        return error_responses.get(error_type, error_responses["general_error"])
+        return _ERROR_RESPONSES.get(error_type, _ERROR_RESPONSES["general_error"])
 
     @staticmethod
     def validate_response_quality(response: str, persona_context: PersonaContext) -> Dict[str, Any]:
@@ -199,31 +246,31 @@ Generate Alex's response now:"""
         }
 
         response_lower = response.lower()
+        tokens = frozenset(_TOKEN_RE.findall(response_lower))
 
         # Check for specific metrics/numbers
-        import re
-        if re.search(r'\d+[k+]?\s*(engineers?|users?|hours?|products?|%)', response_lower):
+        if _METRIC_RE.search(response_lower):
             validation_results["specific_metrics"] = True
             validation_results["overall_score"] += 1
         else:
             validation_results["suggestions"].append("Consider adding specific metrics or numbers from Alex's experience")
 
         # Check for Microsoft experience references
-        if any(term in response_lower for term in ['microsoft', 'azure', 'teams', 'platform']):
+        if _MICROSOFT_TERMS & tokens:
             validation_results["microsoft_experience"] = True
             validation_results["overall_score"] += 1
         else:
             validation_results["suggestions"].append("Include references to Microsoft experience where relevant")
 
         # Check for collaborative language
-        if any(term in response_lower for term in ['team', 'collaborate', 'stakeholder', 'partner']):
+        if _COLLABORATIVE_TERMS & tokens:
             validation_results["collaborative_tone"] = True
             validation_results["overall_score"] += 1
         else:
             validation_results["suggestions"].append("Use more collaborative language reflecting Alex's leadership style")
 
         # Check for technical depth
-        if any(term in response_lower for term in ['api', 'system', 'architecture', 'implementation']):
+        if _TECHNICAL_TERMS & tokens:
             validation_results["technical_depth"] = True
             validation_results["overall_score"] += 1
         else:
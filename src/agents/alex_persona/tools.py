@@ -5,13 +5,160 @@ Provides RAG retrieval, memory management, and persona analysis tools
 for the LangGraph workflow.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from ...core.config import get_config
 from ...core.memory import ConversationMemory
-from ...core.models import ConversationChunk, PersonaContext
+from ...core.models import (EMPTY_PERSONA_CONTEXT, ConversationChunk,
+                            PersonaContext)
 from ...core.rag import ConversationRAG
 from .prompts import AlexPersonaPrompts
 
+logger = logging.getLogger(__name__)
+
+# Prepared-context exact-match cache bounds
+_CONTEXT_CACHE_MAX = 256
+_CONTEXT_CACHE_TTL = 300.0  # seconds
+
+# Persona-analysis memoization bound
+_PERSONA_CACHE_MAX = 64
+
+# Query-driven persona enhancement rules: (trigger tokens, context field, insight)
+_QUERY_TOKEN_RE = re.compile(r'[a-z]+')
+
+# Filler turns that don't warrant retrieval or persona analysis
+_TRIVIAL_QUERY_RE = re.compile(
+    r'^(?:hi|hello|hey|thanks|thank\s+you|ok|okay|yes|no|yep|nope|bye|goodbye)[\s!.?]*$',
+    re.IGNORECASE
+)
+_TRIVIAL_STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'bye', 'cool', 'fine', 'good', 'got', 'great',
+    'hello', 'hey', 'hi', 'i', 'is', 'it', 'nice', 'no', 'ok', 'okay', 'oh',
+    'right', 'see', 'so', 'sure', 'thank', 'thanks', 'that', 'the', 'this',
+    'wow', 'yeah', 'yep', 'yes', 'you'
+})
+_PERSONA_ENHANCEMENT_RULES = [
+    (
+        frozenset({'leadership', 'team', 'teams', 'manage', 'manages', 'managing',
+                   'manager', 'managers', 'management'}),
+        'communication_style',
+        "Leadership and team management focus"
+    ),
+    (
+        frozenset({'technical', 'architecture', 'architectures', 'platform', 'platforms'}),
+        'communication_style',
+        "Technical architecture and platform expertise"
+    ),
+    (
+        frozenset({'ai', 'rag', 'agent', 'agents', 'agentic', 'llm', 'llms'}),
+        'technical_expertise',
+        "AI and agentic systems expertise"
+    ),
+]
+
+# Single alternation over every trigger token; one C-level scan per query
+# instead of tokenizing the whole input (longest alternatives first so
+# 'managers' isn't clipped to 'manage')
+_TRIGGER_RE = re.compile(
+    r'\b(' + '|'.join(sorted(
+        (token for triggers, _, _ in _PERSONA_ENHANCEMENT_RULES for token in triggers),
+        key=len, reverse=True
+    )) + r')\b',
+    re.IGNORECASE
+)
+
+
+class ProximityCache:
+    """
+    Approximate semantic cache mapping query embeddings to retrieval results.
+
+    Stores L2-normalized query embeddings in a preallocated float32 matrix;
+    a lookup whose cosine similarity to a cached key is within tau of 1.0
+    reuses the cached chunks instead of re-running the ANN search.
+    """
+
+    def __init__(self, capacity: int, tau: float):
+        """
+        Initialize the proximity cache.
+
+        Args:
+            capacity: Maximum number of cached queries
+            tau: Similarity slack; hits require cosine similarity >= 1 - tau
+        """
+        self.capacity = capacity
+        self.tau = tau
+        self.keys: Optional[np.ndarray] = None  # Allocated lazily at first store
+        self.values: List[Tuple[int, bool, List[ConversationChunk]]] = []
+        self._last_used: List[int] = []
+        self._clock = 0
+
+    def lookup(self, embedding: np.ndarray, k: int, alex_only: bool = False) -> Optional[List[ConversationChunk]]:
+        """
+        Look up cached chunks for an embedding.
+
+        Args:
+            embedding: L2-normalized query embedding
+            k: Number of chunks the caller needs
+            alex_only: Speaker filter the caller will apply
+
+        Returns:
+            Cached chunk list if a close-enough query with the same filter
+            and at least k requested chunks is cached, None otherwise
+        """
+        if not self.values:
+            return None
+
+        sims = self.keys[:len(self.values)] @ embedding
+        best = int(np.argmax(sims))
+        cached_k, cached_alex_only, chunks = self.values[best]
+
+        if sims[best] >= 1.0 - self.tau and cached_k >= k and cached_alex_only == alex_only:
+            self._clock += 1
+            self._last_used[best] = self._clock
+            return chunks[:k] if len(chunks) > k else chunks
+
+        return None
+
+    def store(self, embedding: np.ndarray, k: int, alex_only: bool, chunks: List[ConversationChunk]) -> None:
+        """
+        Store retrieval results for a query embedding, evicting LRU when full.
+
+        Args:
+            embedding: L2-normalized query embedding
+            k: Number of chunks that were requested
+            alex_only: Speaker filter applied to the search
+            chunks: Retrieved chunks to cache
+        """
+        if self.keys is None:
+            self.keys = np.empty((self.capacity, embedding.shape[0]), dtype=np.float32)
+
+        self._clock += 1
+
+        if len(self.values) < self.capacity:
+            slot = len(self.values)
+            self.values.append((k, alex_only, chunks))
+            self._last_used.append(self._clock)
+        else:
+            slot = self._last_used.index(min(self._last_used))
+            self.values[slot] = (k, alex_only, chunks)
+            self._last_used[slot] = self._clock
+
+        self.keys[slot] = embedding
+
+    def clear(self) -> None:
+        """Drop all cached entries (e.g. after a corpus rebuild)."""
+        self.values.clear()
+        self._last_used.clear()
+        self._clock = 0
+
 
 class RAGRetrievalTool:
     """Tool for retrieving relevant conversation context using RAG."""
@@ -24,25 +171,46 @@ class RAGRetrievalTool:
             rag_system: Configured ConversationRAG instance
         """
         self.rag_system = rag_system
+        config = get_config()
+        self._proximity_cache = ProximityCache(config.rag_cache_size, config.rag_cache_tau)
 
-    async def retrieve_context(self, query: str, k: int = 5) -> List[ConversationChunk]:
+    async def retrieve_context(self, query: str, k: int = 5, alex_only: bool = False) -> List[ConversationChunk]:
         """
         Retrieve relevant conversation chunks for a query.
 
+        Repeated or closely paraphrased queries are served from a proximity
+        cache keyed on the query embedding, skipping the vector search.
+
         Args:
             query: User query to find context for
             k: Number of chunks to retrieve
+            alex_only: If True, restrict the search to Alex's chunks
 
         Returns:
             List of relevant ConversationChunk objects
         """
         try:
-            chunks = await self.rag_system.similarity_search(query, k=k)
+            embedding = await self.rag_system._get_embedding(query)
+            norm = np.linalg.norm(embedding)
+            if norm > 0:
+                # Not in place: the array may be a shared cache entry
+                embedding = embedding / norm
+
+            cached = self._proximity_cache.lookup(embedding, k, alex_only)
+            if cached is not None:
+                return cached
+
+            chunks = await self._search(query, k, alex_only)
+            self._proximity_cache.store(embedding, k, alex_only, chunks)
             return chunks
-        except Exception as e:
-            print(f"Error in RAG retrieval: {e}")
+        except Exception:
+            logger.exception("RAG retrieval failed")
             return []
 
+    async def _search(self, query: str, k: int, alex_only: bool = False) -> List[ConversationChunk]:
+        """Run the underlying vector search for a single query."""
+        return await self.rag_system.similarity_search(query, k=k, alex_only=alex_only)
+
     async def get_alex_specific_context(self, query: str, k: int = 5) -> List[ConversationChunk]:
         """
         Retrieve context specifically from Alex's responses.
@@ -54,13 +222,78 @@ class RAGRetrievalTool:
         Returns:
             List of Alex's relevant conversation chunks
         """
-        all_chunks = await self.retrieve_context(query, k * 2)  # Get more to filter
+        # The speaker filter runs inside the index, so a single k-sized
+        # search replaces the old fetch-2k-then-filter pass
+        return await self.retrieve_context(query, k, alex_only=True)
+
+    def invalidate_cache(self) -> None:
+        """Invalidate the proximity cache after the corpus changes."""
+        self._proximity_cache.clear()
+
 
-        # Filter for Alex's chunks only
-        from ...core.utils import is_alex_speaker
-        alex_chunks = [chunk for chunk in all_chunks if is_alex_speaker(chunk.speaker)]
+class BatchingRAGRetrievalTool(RAGRetrievalTool):
+    """
+    RAG retrieval tool that coalesces concurrent queries into batched searches.
+
+    Queries arriving within a short window are collected and dispatched as a
+    single batch_similarity_search call, amortizing per-request overhead when
+    several sessions (or agent fan-outs) query at once.
+    """
+
+    def __init__(self, rag_system: ConversationRAG):
+        """
+        Initialize the batching retrieval tool.
 
-        return alex_chunks[:k]
+        Args:
+            rag_system: Configured ConversationRAG instance
+        """
+        super().__init__(rag_system)
+        config = get_config()
+        self.batch_size = config.rag_batch_size
+        self.batch_window = config.rag_batch_window_ms / 1000.0
+        self._pending: List[Tuple[str, int, bool, Any]] = []
+        self._flush_task: Optional[Any] = None
+
+    async def _search(self, query: str, k: int, alex_only: bool = False) -> List[ConversationChunk]:
+        """Enqueue the query and await the result of the next batch flush."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, k, alex_only, future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Wait out the batching window, then dispatch pending queries together."""
+        await asyncio.sleep(self.batch_window)
+
+        while self._pending:
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+
+            # Queries sharing a speaker filter can share one batched search
+            for alex_only in (False, True):
+                group = [item for item in batch if item[2] == alex_only]
+                if not group:
+                    continue
+
+                queries = [query for query, _, _, _ in group]
+                max_k = max(k for _, k, _, _ in group)
+
+                try:
+                    results = await self.rag_system.batch_similarity_search(
+                        queries, k=max_k, alex_only=alex_only
+                    )
+                except Exception as e:
+                    for _, _, _, future in group:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, k, _, future), chunks in zip(group, results):
+                    if not future.done():
+                        future.set_result(chunks[:k])
 
 
 class PersonaAnalysisTool:
@@ -75,22 +308,42 @@ class PersonaAnalysisTool:
         """
         self.rag_system = rag_system
 
+        # Memoized analyses keyed by the set of analyzed chunk ids
+        self._persona_cache: "OrderedDict[frozenset, PersonaContext]" = OrderedDict()
+
     async def analyze_persona(self, retrieved_chunks: List[ConversationChunk]) -> PersonaContext:
         """
         Analyze retrieved chunks to extract persona characteristics.
 
+        Consecutive turns often retrieve the same chunk set, so results are
+        memoized on the chunk ids and copied out for safe enhancement.
+
         Args:
             retrieved_chunks: Conversation chunks to analyze
 
         Returns:
             PersonaContext with extracted characteristics
         """
+        cache_key = frozenset(chunk.id for chunk in retrieved_chunks)
+
+        cached = self._persona_cache.get(cache_key)
+        if cached is not None:
+            self._persona_cache.move_to_end(cache_key)
+            # Copy so enhance_persona_context mutations don't pollute the cache
+            return cached.model_copy(deep=True)
+
         try:
             persona_context = await self.rag_system.analyze_persona_context(retrieved_chunks)
-            return persona_context
-        except Exception as e:
-            print(f"Error in persona analysis: {e}")
-            return PersonaContext()  # Return empty context on error
+        except Exception:
+            logger.exception("Persona analysis failed")
+            # Copy the shared empty context since callers may enhance it
+            return EMPTY_PERSONA_CONTEXT.model_copy(deep=True)
+
+        self._persona_cache[cache_key] = persona_context.model_copy(deep=True)
+        while len(self._persona_cache) > _PERSONA_CACHE_MAX:
+            self._persona_cache.popitem(last=False)
+
+        return persona_context
 
     def enhance_persona_context(self, persona_context: PersonaContext, query: str) -> PersonaContext:
         """
@@ -103,20 +356,14 @@ class PersonaAnalysisTool:
         Returns:
             Enhanced PersonaContext
         """
-        query_lower = query.lower()
-
-        # Add query-specific communication style insights
-        if any(term in query_lower for term in ['leadership', 'team', 'manage']):
-            if "Leadership and team management focus" not in persona_context.communication_style:
-                persona_context.communication_style.append("Leadership and team management focus")
-
-        if any(term in query_lower for term in ['technical', 'architecture', 'platform']):
-            if "Technical architecture and platform expertise" not in persona_context.communication_style:
-                persona_context.communication_style.append("Technical architecture and platform expertise")
+        matched = {match.lower() for match in _TRIGGER_RE.findall(query)}
 
-        if any(term in query_lower for term in ['ai', 'rag', 'agent', 'llm']):
-            if "AI and agentic systems expertise" not in persona_context.technical_expertise:
-                persona_context.technical_expertise.append("AI and agentic systems expertise")
+        # Apply query-specific insights from the precompiled rule table
+        for triggers, field, insight in _PERSONA_ENHANCEMENT_RULES:
+            if triggers & matched:
+                values = getattr(persona_context, field)
+                if insight not in values:
+                    values.append(insight)
 
         return persona_context
 
@@ -164,6 +411,22 @@ class ConversationMemoryTool:
         """
         return self.memory_manager.get_conversation_history(limit)
 
+    async def commit_turn(
+        self,
+        user_content: str,
+        assistant_content: str,
+        context_used: Optional[PersonaContext] = None
+    ) -> None:
+        """
+        Store a full user/assistant turn and persist in the background.
+
+        Args:
+            user_content: User message content
+            assistant_content: Assistant response content
+            context_used: Optional persona context used for the response
+        """
+        await self.memory_manager.commit_turn(user_content, assistant_content, context_used)
+
     def save_session(self) -> None:
         """Save current session to persistent storage."""
         self.memory_manager.save_session()
@@ -188,11 +451,36 @@ class AlexPersonaToolkit:
             rag_system: RAG system for context retrieval
             memory_manager: Memory system for conversation persistence
         """
-        self.rag_tool = RAGRetrievalTool(rag_system)
+        self.rag_tool = BatchingRAGRetrievalTool(rag_system)
         self.persona_tool = PersonaAnalysisTool(rag_system)
         self.memory_tool = ConversationMemoryTool(memory_manager)
         self.prompts = AlexPersonaPrompts()
 
+        # Exact-match cache for prepared response contexts
+        self._context_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._context_cache_lock = asyncio.Lock()
+
+    @staticmethod
+    def _is_trivial(query: str) -> bool:
+        """Check whether a query is filler that can skip retrieval."""
+        stripped = query.strip()
+        if _TRIVIAL_QUERY_RE.match(stripped):
+            return True
+
+        tokens = _QUERY_TOKEN_RE.findall(stripped.lower())
+        return len(tokens) <= 2 and all(token in _TRIVIAL_STOPWORDS for token in tokens)
+
+    @staticmethod
+    def _history_fingerprint(conversation_history: List[Dict[str, str]]) -> str:
+        """Fingerprint the recent history so cache keys track the conversation."""
+        digest = hashlib.blake2b(digest_size=16)
+        for msg in conversation_history:
+            digest.update(msg["role"].encode())
+            digest.update(b"\x00")
+            digest.update(msg["content"].encode())
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
     async def prepare_response_context(
         self,
         query: str,
@@ -201,6 +489,9 @@ class AlexPersonaToolkit:
         """
         Prepare comprehensive context for response generation.
 
+        Identical (query, k, history) inputs are served from a short-TTL
+        exact-match cache, skipping retrieval and persona analysis.
+
         Args:
             query: User query
             k_chunks: Number of RAG chunks to retrieve
@@ -209,6 +500,38 @@ class AlexPersonaToolkit:
             Dictionary with all context needed for response generation
         """
         try:
+            # Get conversation history (also part of the cache key)
+            conversation_history = self.memory_tool.get_conversation_context()
+
+            # Greetings and filler skip the ANN search and persona analysis
+            if self._is_trivial(query):
+                persona_context = EMPTY_PERSONA_CONTEXT.model_copy(deep=True)
+                return {
+                    "retrieved_chunks": [],
+                    "persona_context": persona_context,
+                    "conversation_history": conversation_history,
+                    "response_prompt": self.prompts.get_response_generation_prompt(
+                        query, persona_context, conversation_history
+                    ),
+                    "query": query
+                }
+
+            cache_key = (
+                query.strip().lower(),
+                k_chunks,
+                self._history_fingerprint(conversation_history)
+            )
+            now = time.monotonic()
+
+            async with self._context_cache_lock:
+                cached = self._context_cache.get(cache_key)
+                if cached is not None:
+                    cached_at, context = cached
+                    if now - cached_at < _CONTEXT_CACHE_TTL:
+                        self._context_cache.move_to_end(cache_key)
+                        return context
+                    del self._context_cache[cache_key]
+
             # Retrieve relevant conversation chunks
             retrieved_chunks = await self.rag_tool.get_alex_specific_context(query, k_chunks)
 
@@ -216,15 +539,12 @@ class AlexPersonaToolkit:
             persona_context = await self.persona_tool.analyze_persona(retrieved_chunks)
             persona_context = self.persona_tool.enhance_persona_context(persona_context, query)
 
-            # Get conversation history
-            conversation_history = self.memory_tool.get_conversation_context()
-
             # Prepare response prompt
             response_prompt = self.prompts.get_response_generation_prompt(
                 query, persona_context, conversation_history
             )
 
-            return {
+            context = {
                 "retrieved_chunks": retrieved_chunks,
                 "persona_context": persona_context,
                 "conversation_history": conversation_history,
@@ -232,12 +552,19 @@ class AlexPersonaToolkit:
                 "query": query
             }
 
+            async with self._context_cache_lock:
+                self._context_cache[cache_key] = (now, context)
+                while len(self._context_cache) > _CONTEXT_CACHE_MAX:
+                    self._context_cache.popitem(last=False)
+
+            return context
+
         except Exception as e:
-            print(f"Error preparing response context: {e}")
+            logger.exception("Failed to prepare response context")
             # Return minimal context on error
             return {
                 "retrieved_chunks": [],
-                "persona_context": PersonaContext(),
+                "persona_context": EMPTY_PERSONA_CONTEXT,
                 "conversation_history": self.memory_tool.get_conversation_context(),
                 "response_prompt": self.prompts.get_error_response_prompt("context_error"),
                 "query": query,
@@ -261,17 +588,14 @@ class AlexPersonaToolkit:
         Returns:
             Validation results and storage status
         """
-        # Add user message to memory
-        self.memory_tool.add_user_message(query)
-
         # Validate response quality
         validation_results = self.prompts.validate_response_quality(response, persona_context)
 
-        # Add assistant response to memory
-        self.memory_tool.add_assistant_message(response, persona_context)
+        # Store the full turn; persistence happens off the event loop
+        await self.memory_tool.commit_turn(query, response, persona_context)
 
-        # Save session
-        self.memory_tool.save_session()
+        # History changed, so previously prepared contexts are stale
+        self._context_cache.clear()
 
         return {
             "validation": validation_results,
@@ -299,7 +623,7 @@ class AlexPersonaToolkit:
         # Add session state to memory for recovery
         self.memory_tool.add_assistant_message(
             f"Error encountered: {base_response}",
-            PersonaContext()
+            EMPTY_PERSONA_CONTEXT
         )
 
         return base_response
@@ -5,9 +5,14 @@ Provides abstract base classes and common interfaces for all AI agents
 following the Plan/Act pattern from PLANNING.md.
 """
 
+import tempfile
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, List, Optional
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Tuple
 
 from ..core.models import ConversationState
 
@@ -15,17 +20,23 @@ from ..core.models import ConversationState
 class BaseAgent(ABC):
     """Abstract base class for all AI agents in the system."""
 
-    def __init__(self, agent_name: str):
+    def __init__(self, agent_name: str, history_maxlen: int = 50):
         """
         Initialize the base agent.
 
         Args:
             agent_name: Unique name for this agent
+            history_maxlen: Maximum number of logged states to retain
         """
         self.agent_name = agent_name
         self.created_at = datetime.now()
         self.tools: Dict[str, Any] = {}
-        self.state_history: List[ConversationState] = []
+
+        # Logged states live on disk; only (offset, length) pairs stay in RAM
+        self._state_log_path = Path(tempfile.gettempdir()) / f"{agent_name}.states"
+        self._state_offsets: Deque[Tuple[int, int]] = deque(maxlen=history_maxlen)
+        self._states_logged = 0
+        self._last_state_at: Optional[datetime] = None
 
     @abstractmethod
     async def process(self, input_state: ConversationState) -> ConversationState:
@@ -79,30 +90,89 @@ class BaseAgent(ABC):
         """
         Log a conversation state for debugging and analysis.
 
+        States are appended to a capped on-disk log instead of being kept
+        alive in memory; use get_state to load one back for inspection.
+
         Args:
             state: Conversation state to log
         """
-        self.state_history.append(state)
+        record = state.model_dump_json().encode("utf-8")
+
+        try:
+            if self._states_logged >= 2 * (self._state_offsets.maxlen or 1):
+                self._compact_state_log()
+
+            with open(self._state_log_path, "ab") as f:
+                offset = f.tell()
+                f.write(record + b"\n")
+        except OSError:
+            # State logging is best-effort; never fail the request over it
+            return
 
-        # Keep only recent states to prevent memory growth
-        if len(self.state_history) > 100:
-            self.state_history = self.state_history[-50:]
+        self._state_offsets.append((offset, len(record)))
+        self._states_logged += 1
+        self._last_state_at = datetime.now()
 
-    def get_agent_info(self) -> Dict[str, Any]:
+    def get_state(self, index: int) -> Optional[ConversationState]:
         """
-        Get information about this agent.
+        Load a logged conversation state from disk.
+
+        Args:
+            index: History index (supports negative indexing, -1 is newest)
 
         Returns:
-            Dictionary with agent metadata
+            The decoded ConversationState, or None if unavailable
         """
+        try:
+            offset, length = self._state_offsets[index]
+            with open(self._state_log_path, "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+            return ConversationState.model_validate_json(data)
+        except (IndexError, OSError, ValueError):
+            return None
+
+    def _compact_state_log(self) -> None:
+        """Rewrite the state log keeping only the still-tracked records."""
+        records = []
+        with open(self._state_log_path, "rb") as f:
+            for offset, length in self._state_offsets:
+                f.seek(offset)
+                records.append(f.read(length))
+
+        offset = 0
+        with open(self._state_log_path, "wb") as f:
+            for record in records:
+                f.write(record + b"\n")
+
+        self._state_offsets.clear()
+        for record in records:
+            self._state_offsets.append((offset, len(record)))
+            offset += len(record) + 1
+        self._states_logged = len(records)
+
+    @cached_property
+    def _static_info(self) -> Dict[str, Any]:
+        """Immutable agent metadata, built once per agent."""
         return {
             "name": self.agent_name,
-            "created_at": self.created_at,
-            "tools_count": len(self.tools),
-            "states_processed": len(self.state_history),
-            "last_activity": self.state_history[-1].timestamp if self.state_history else None
+            "created_at": self.created_at
         }
 
+    def get_agent_info(self) -> Mapping[str, Any]:
+        """
+        Get information about this agent.
+
+        Returns:
+            Read-only mapping with agent metadata
+        """
+        return MappingProxyType({
+            **self._static_info,
+            "tools_count": len(self.tools),
+            "states_processed": len(self._state_offsets),
+            "last_activity": self._last_state_at
+        })
+
 
 class AgenticWorkflow(ABC):
     """Abstract base class for agentic workflows using LangGraph patterns."""
@@ -116,7 +186,9 @@ class AgenticWorkflow(ABC):
         """
         self.workflow_name = workflow_name
         self.nodes: Dict[str, Any] = {}
-        self.edges: List[tuple] = []
+        self._edges: List[Tuple[str, str]] = []
+        self._adj: Dict[str, List[str]] = defaultdict(list)
+        self._workflow_info: Optional[Mapping[str, Any]] = None
 
     @abstractmethod
     def build_graph(self) -> Any:
@@ -150,6 +222,7 @@ class AgenticWorkflow(ABC):
             function: Function to execute for this node
         """
         self.nodes[name] = function
+        self._workflow_info = None
 
     def add_edge(self, from_node: str, to_node: str) -> None:
         """
@@ -159,19 +232,43 @@ class AgenticWorkflow(ABC):
             from_node: Source node name
             to_node: Target node name
         """
-        self.edges.append((from_node, to_node))
+        self._edges.append((from_node, to_node))
+        self._adj[from_node].append(to_node)
+        self._workflow_info = None
+
+    @property
+    def edges(self) -> Tuple[Tuple[str, str], ...]:
+        """Read-only view of the workflow edges."""
+        return tuple(self._edges)
+
+    def neighbors(self, node: str) -> Tuple[str, ...]:
+        """
+        Get the successor nodes of a workflow node in O(1).
+
+        Args:
+            node: Node name to look up
+
+        Returns:
+            Tuple of node names reachable by one edge
+        """
+        return tuple(self._adj.get(node, ()))
 
-    def get_workflow_info(self) -> Dict[str, Any]:
+    def get_workflow_info(self) -> Mapping[str, Any]:
         """
         Get information about this workflow.
 
         Returns:
-            Dictionary with workflow metadata
+            Read-only mapping with workflow metadata
         """
-        return {
-            "name": self.workflow_name,
-            "nodes": list(self.nodes.keys()),
-            "edges": self.edges,
-            "node_count": len(self.nodes),
-            "edge_count": len(self.edges)
-        }
+        # Rebuilt lazily only after the graph changes; tuples keep callers
+        # from mutating the node and edge collections through the view
+        if self._workflow_info is None:
+            self._workflow_info = MappingProxyType({
+                "name": self.workflow_name,
+                "nodes": tuple(self.nodes),
+                "edges": tuple(self._edges),
+                "node_count": len(self.nodes),
+                "edge_count": len(self._edges)
+            })
+
+        return self._workflow_info
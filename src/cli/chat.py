@@ -6,10 +6,14 @@ session management, and helpful commands.
 """
 
 import asyncio
+import logging
 import sys
+import time
 from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
@@ -36,16 +40,17 @@ class ChatCLI:
 
         # CLI state
         self.session_started = False
-
-        # Commands mapping
-        self.commands = {
-            '/help': self._show_help,
-            '/reset': self._reset_session,
-            '/history': self._show_history,
-            '/session': self._show_session_info,
-            '/starters': self._show_conversation_starters,
-            '/quit': self._quit_chat,
-            '/exit': self._quit_chat
+        self._starters_panel: Optional[Panel] = None
+
+        # Command dispatch table; aliases share the same bound method
+        self._cmd_table: Dict[str, Callable[[List[str]], Awaitable[bool]]] = {
+            'help': self._show_help,
+            'reset': self._reset_session,
+            'history': self._show_history,
+            'session': self._show_session_info,
+            'starters': self._show_conversation_starters,
+            'quit': self._quit_chat,
+            'exit': self._quit_chat
         }
 
     async def start_chat(self) -> None:
@@ -134,7 +139,7 @@ Let's chat!
         self.console.print(f"\n[dim]{timestamp}[/dim] [bold cyan]You:[/bold cyan] {message}")
 
         # Show Alex typing indicator and stream response
-        response_text = ""
+        parts: List[str] = []
 
         with Live(
             Panel(
@@ -147,16 +152,31 @@ Let's chat!
         ) as live:
 
             try:
-                async for token in self.agent.stream_response(message):
-                    response_text += token
+                # Re-render at most ~10 times/sec; per-token Markdown parsing
+                # makes streaming quadratic in response length
+                last_render = 0.0
 
-                    # Update live display with accumulated response
-                    live.update(Panel(
-                        Markdown(response_text),
-                        title=f"[bold green]🧠 Alex[/bold green] [dim]{timestamp}[/dim]",
-                        border_style="green",
-                        padding=(1, 2)
-                    ))
+                async for token in self.agent.stream_response(message):
+                    parts.append(token)
+
+                    now = time.monotonic()
+                    if now - last_render > 0.1:
+                        last_render = now
+                        # Plain text while streaming; Markdown once at the end
+                        live.update(Panel(
+                            Text("".join(parts)),
+                            title=f"[bold green]🧠 Alex[/bold green] [dim]{timestamp}[/dim]",
+                            border_style="green",
+                            padding=(1, 2)
+                        ))
+
+                # Final render with full Markdown formatting
+                live.update(Panel(
+                    Markdown("".join(parts)),
+                    title=f"[bold green]🧠 Alex[/bold green] [dim]{timestamp}[/dim]",
+                    border_style="green",
+                    padding=(1, 2)
+                ))
 
             except Exception as e:
                 error_msg = f"Sorry, I encountered an error: {e}"
@@ -178,16 +198,17 @@ Let's chat!
         Returns:
             True to continue chat loop, False to exit
         """
-        command = command.strip().lower()
+        head, *args = command[1:].strip().lower().split() or ['']
 
-        if command in self.commands:
-            return await self.commands[command]()
-        else:
-            self.console.print(f"[red]Unknown command: {command}[/red]")
-            self.console.print("Type [cyan]/help[/cyan] for available commands.")
-            return True
+        handler = self._cmd_table.get(head)
+        if handler is not None:
+            return await handler(args)
+
+        self.console.print(f"[red]Unknown command: /{head}[/red]")
+        self.console.print("Type [cyan]/help[/cyan] for available commands.")
+        return True
 
-    async def _show_help(self) -> bool:
+    async def _show_help(self, args: List[str]) -> bool:
         """Show help information."""
         help_text = """
 # Available Commands
@@ -217,14 +238,14 @@ Let's chat!
         ))
         return True
 
-    async def _reset_session(self) -> bool:
+    async def _reset_session(self, args: List[str]) -> bool:
         """Reset the conversation session."""
         self.agent.reset_conversation()
         self.console.print("[green]✅ Conversation reset. Starting fresh![/green]")
         return True
 
-    async def _show_history(self) -> bool:
-        """Show conversation history."""
+    async def _show_history(self, args: List[str]) -> bool:
+        """Show conversation history, optionally limited by a count argument."""
         session_info = self.agent.get_session_info()
 
         if session_info.get("total_messages", 0) == 0:
@@ -237,10 +258,15 @@ Let's chat!
         table.add_column("Role", width=10)
         table.add_column("Message", width=60)
 
-        # Get recent history from memory
-        history = self.agent.toolkit.memory_tool.get_conversation_context(limit=10)
+        # Get recent history from memory; '/history 20' widens the window
+        try:
+            limit = int(args[0]) if args else 5
+        except ValueError:
+            limit = 5
+
+        history = self.agent.toolkit.memory_tool.get_conversation_context(limit=max(limit, 10))
 
-        for msg in history[-5:]:  # Show last 5 messages
+        for msg in history[-limit:]:
             role = "🧠 Alex" if msg["role"] == "assistant" else "👤 You"
             content = msg["content"]
 
@@ -253,7 +279,7 @@ Let's chat!
         self.console.print(table)
         return True
 
-    async def _show_session_info(self) -> bool:
+    async def _show_session_info(self, args: List[str]) -> bool:
         """Show current session information."""
         session_info = self.agent.get_session_info()
 
@@ -276,26 +302,30 @@ Let's chat!
         ))
         return True
 
-    async def _show_conversation_starters(self) -> bool:
+    async def _show_conversation_starters(self, args: List[str]) -> bool:
         """Show conversation starter suggestions."""
-        starters = self.agent.get_conversation_starters()
+        # Starters are static, so render the panel once and reuse it
+        if self._starters_panel is None:
+            starters = self.agent.get_conversation_starters()
 
-        starter_text = "# 💡 Conversation Starters\n\nHere are some topics I'd love to discuss:\n\n"
+            starter_text = "# 💡 Conversation Starters\n\nHere are some topics I'd love to discuss:\n\n"
 
-        for i, starter in enumerate(starters[:8], 1):
-            starter_text += f"{i}. {starter}\n"
+            for i, starter in enumerate(starters[:8], 1):
+                starter_text += f"{i}. {starter}\n"
 
-        starter_text += "\nJust copy and paste one of these, or ask about anything else you're curious about!"
+            starter_text += "\nJust copy and paste one of these, or ask about anything else you're curious about!"
 
-        self.console.print(Panel(
-            Markdown(starter_text),
-            title="🚀 Ideas",
-            border_style="green",
-            padding=(1, 2)
-        ))
+            self._starters_panel = Panel(
+                Markdown(starter_text),
+                title="🚀 Ideas",
+                border_style="green",
+                padding=(1, 2)
+            )
+
+        self.console.print(self._starters_panel)
         return True
 
-    async def _quit_chat(self) -> bool:
+    async def _quit_chat(self, args: List[str]) -> bool:
         """Quit the chat session."""
         self.running = False
         return False
@@ -323,6 +353,15 @@ Feel free to reach out anytime to discuss platform engineering, AI systems, or a
 async def run_chat_cli() -> None:
     """Run the chat CLI application."""
     try:
+        # Route logs through Rich so they don't corrupt the Live renderer;
+        # basicConfig is a no-op if the entry point already configured logging
+        from ..core.config import get_config
+        logging.basicConfig(
+            level=getattr(logging, get_config().log_level.upper(), logging.INFO),
+            format="%(message)s",
+            handlers=[RichHandler(rich_tracebacks=True)]
+        )
+
         # Create and initialize agent
         agent = AlexPersonaAgent()
 
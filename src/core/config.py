@@ -5,9 +5,13 @@ Handles environment variables, API clients, and application settings
 using python-dotenv for Windows compatibility.
 """
 
+import importlib.util
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
+import httpx
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
@@ -37,23 +41,48 @@ class Config:
         self.chunk_overlap = int(os.getenv("CHUNK_OVERLAP", "200"))
         self.max_tokens_per_response = int(os.getenv("MAX_TOKENS_PER_RESPONSE", "2000"))
 
+        # RAG proximity cache (semantic cache for retrieval results)
+        self.rag_cache_size = int(os.getenv("RAG_CACHE_SIZE", "256"))
+        self.rag_cache_tau = float(os.getenv("RAG_CACHE_TAU", "0.05"))
+
+        # RAG query batching (coalesce concurrent searches)
+        self.rag_batch_size = int(os.getenv("RAG_BATCH_SIZE", "8"))
+        self.rag_batch_window_ms = float(os.getenv("RAG_BATCH_WINDOW_MS", "10"))
+
         # Logging
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
 
+        # Shared OpenAI client, created lazily on first use
+        self._openai_client: Optional[AsyncOpenAI] = None
+
         # Ensure directories exist
         self._create_directories()
 
     def _create_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        self.vector_store_path.mkdir(parents=True, exist_ok=True)
-        self.session_store_path.mkdir(parents=True, exist_ok=True)
+        for path in (self.vector_store_path, self.session_store_path):
+            # Skip the mkdir syscall entirely on the warm path
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
 
     def get_openai_client(self) -> AsyncOpenAI:
-        """Get configured OpenAI async client."""
+        """Get the shared OpenAI async client, creating it on first use."""
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
 
-        return AsyncOpenAI(api_key=self.openai_api_key)
+        if self._openai_client is None:
+            # Reuse one connection pool across all LLM/embedding calls;
+            # HTTP/2 is enabled when the optional h2 package is available
+            http_client = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+            )
+            self._openai_client = AsyncOpenAI(
+                api_key=self.openai_api_key,
+                http_client=http_client
+            )
+
+        return self._openai_client
 
     def validate_config(self) -> None:
         """Validate that all required configuration is present."""
@@ -64,5 +93,7 @@ class Config:
             raise ValueError(f"Conversation data path does not exist: {self.conversation_data_path}")
 
 
-# Global configuration instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared application configuration, created on first use."""
+    return Config()
@@ -5,14 +5,28 @@ Handles conversation session persistence, history management, and memory optimiz
 for maintaining context across chat interactions.
 """
 
-import json
+import asyncio
+import os
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
-from .config import config
-from .models import ChatMessage, ChatSession, PersonaContext
+from .config import get_config
+from .models import (ChatMessage, ChatSession, ConversationChunk,
+                     PersonaContext)
+from .utils import json_dumps as _dumps
+from .utils import json_loads as _loads
+
+# Sidecar cache for list_sessions metadata, keyed by file mtime
+_LISTING_CACHE_NAME = ".listing_cache.json"
+
+# Chunk embeddings are redundant with the FAISS index; drop them on save
+_SESSION_DUMP_EXCLUDE = {
+    'messages': {'__all__': {'context_used': {'relevant_chunks': {'__all__': {'embedding'}}}}}
+}
 
 
 class ConversationMemory:
@@ -25,12 +39,20 @@ class ConversationMemory:
         Args:
             session_store_path: Path to store session files, uses config default if None
         """
+        config = get_config()
         self.session_store_path = session_store_path or config.session_store_path
         self.max_history = config.max_conversation_history
 
         # Current active session
         self.current_session: Optional[ChatSession] = None
 
+        # Live message buffer; the deque evicts oldest messages in O(1)
+        self._messages: Deque[ChatMessage] = deque(maxlen=self.max_history)
+
+        # Background persistence state for commit_turn
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_dirty = False
+
     def create_session(self, session_id: Optional[str] = None) -> ChatSession:
         """
         Create a new chat session.
@@ -52,6 +74,7 @@ class ConversationMemory:
         )
 
         self.current_session = session
+        self._messages.clear()
         return session
 
     def add_message(self, role: str, content: str, context_used: Optional[PersonaContext] = None) -> None:
@@ -73,11 +96,46 @@ class ConversationMemory:
             context_used=context_used
         )
 
-        self.current_session.messages.append(message)
+        self._messages.append(message)
         self.current_session.updated_at = datetime.now()
 
-        # Trim history if it exceeds max length
-        self._trim_history()
+    async def commit_turn(
+        self,
+        user_content: str,
+        assistant_content: str,
+        context_used: Optional[PersonaContext] = None
+    ) -> None:
+        """
+        Append a full user/assistant turn and persist in the background.
+
+        Both messages are added in one call and the session is saved in a
+        worker thread, so the chat loop never waits on disk I/O.
+
+        Args:
+            user_content: User message content
+            assistant_content: Assistant response content
+            context_used: Optional RAG context used for the response
+        """
+        self.add_message("user", user_content)
+        self.add_message("assistant", assistant_content, context_used)
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Persist the session off the event loop, coalescing rapid saves."""
+        if self._save_task is not None and not self._save_task.done():
+            # A save is already in flight; it will run once more when done
+            self._save_dirty = True
+            return
+
+        self._save_task = asyncio.create_task(self._save_in_thread())
+
+    async def _save_in_thread(self) -> None:
+        """Run save_session in a worker thread until no saves are pending."""
+        while True:
+            self._save_dirty = False
+            await asyncio.to_thread(self.save_session)
+            if not self._save_dirty:
+                return
 
     def get_conversation_history(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
         """
@@ -89,12 +147,13 @@ class ConversationMemory:
         Returns:
             List of message dictionaries with role and content
         """
-        if self.current_session is None or not self.current_session.messages:
+        if self.current_session is None or not self._messages:
             return []
 
-        messages = self.current_session.messages
+        messages = self._messages
         if limit:
-            messages = messages[-limit:]
+            # Walk back from the newest message; no full-list slice
+            messages = list(islice(reversed(messages), limit))[::-1]
 
         return [
             {"role": msg.role, "content": msg.content}
@@ -107,14 +166,53 @@ class ConversationMemory:
             return
 
         session_file = self.session_store_path / f"{self.current_session.session_id}.json"
+        self.current_session.messages = list(self._messages)
 
         try:
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(self.current_session.model_dump(), f, indent=2, default=str)
+            session_file.write_bytes(
+                _dumps(self.current_session.model_dump(exclude=_SESSION_DUMP_EXCLUDE))
+            )
+            self._update_listing_cache(session_file)
 
         except Exception as e:
             print(f"Error saving session: {e}")
 
+    def _update_listing_cache(self, session_file: Path) -> None:
+        """
+        Record the saved session's listing metadata in the sidecar cache.
+
+        Sessions written by this process never need re-parsing in
+        list_sessions; the metadata is captured here while it is in memory.
+
+        Args:
+            session_file: Path of the session file that was just written
+        """
+        messages = self.current_session.messages
+        last_message = messages[-1].content if messages else "No messages"
+        if len(last_message) > 100:
+            last_message = last_message[:97] + "..."
+
+        info = {
+            "session_id": self.current_session.session_id,
+            "created_at": str(self.current_session.created_at),
+            "updated_at": str(self.current_session.updated_at),
+            "message_count": len(messages),
+            "last_message": last_message
+        }
+
+        cache_path = self.session_store_path / _LISTING_CACHE_NAME
+        try:
+            cache = _loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
+
+        cache[session_file.name] = {"mtime": session_file.stat().st_mtime, "info": info}
+
+        try:
+            cache_path.write_bytes(_dumps(cache))
+        except OSError:
+            pass
+
     def load_session(self, session_id: str) -> Optional[ChatSession]:
         """
         Load a session from disk.
@@ -131,17 +229,72 @@ class ConversationMemory:
             return None
 
         try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            session_data = _loads(session_file.read_bytes())
 
-            session = ChatSession(**session_data)
+            try:
+                # Sessions are written by this same code path, so skip the
+                # per-field revalidation that ChatSession(**data) would do
+                session = self._construct_session(session_data)
+            except Exception:
+                session = ChatSession(**session_data)
             self.current_session = session
+            self._messages = deque(session.messages, maxlen=self.max_history)
             return session
 
         except Exception as e:
             print(f"Error loading session {session_id}: {e}")
             return None
 
+    @staticmethod
+    def _parse_timestamp(value: Any) -> Any:
+        """Parse an ISO timestamp string, passing other values through."""
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+    @classmethod
+    def _construct_session(cls, session_data: Dict[str, Any]) -> ChatSession:
+        """
+        Rebuild a session from trusted on-disk data without revalidation.
+
+        model_construct skips Pydantic validation but does not recurse, so
+        the nested messages, persona contexts and chunks are constructed
+        explicitly; only the datetime fields need parsing.
+
+        Args:
+            session_data: Decoded session JSON
+
+        Returns:
+            ChatSession with fully constructed nested models
+        """
+        messages = []
+        for message_data in session_data.get("messages", []):
+            context_data = message_data.get("context_used")
+            context = None
+            if context_data is not None:
+                context = PersonaContext.model_construct(**{
+                    **context_data,
+                    "relevant_chunks": [
+                        ConversationChunk.model_construct(**{
+                            **chunk_data,
+                            "timestamp": cls._parse_timestamp(chunk_data.get("timestamp"))
+                        })
+                        for chunk_data in context_data.get("relevant_chunks", [])
+                    ]
+                })
+
+            messages.append(ChatMessage.model_construct(
+                role=message_data["role"],
+                content=message_data["content"],
+                timestamp=cls._parse_timestamp(message_data.get("timestamp")),
+                context_used=context
+            ))
+
+        return ChatSession.model_construct(
+            session_id=session_data["session_id"],
+            messages=messages,
+            created_at=cls._parse_timestamp(session_data.get("created_at")),
+            updated_at=cls._parse_timestamp(session_data.get("updated_at"))
+        )
+
     def list_sessions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         List recent sessions with metadata.
@@ -152,13 +305,36 @@ class ConversationMemory:
         Returns:
             List of session metadata dictionaries
         """
-        session_files = list(self.session_store_path.glob("*.json"))
-        session_info = []
+        cache_path = self.session_store_path / _LISTING_CACHE_NAME
+        try:
+            cache = _loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
 
-        for session_file in session_files:
-            try:
-                with open(session_file, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
+        session_info = []
+        seen = set()
+        dirty = False
+
+        # scandir yields each file's stat in one pass, so unchanged files
+        # cost a stat call instead of a full JSON parse
+        with os.scandir(self.session_store_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or entry.name == _LISTING_CACHE_NAME:
+                    continue
+
+                seen.add(entry.name)
+                mtime = entry.stat().st_mtime
+
+                cached = cache.get(entry.name)
+                if cached is not None and cached.get("mtime") == mtime:
+                    session_info.append(cached["info"])
+                    continue
+
+                try:
+                    session_data = _loads(Path(entry.path).read_bytes())
+                except Exception as e:
+                    print(f"Error reading session file {entry.path}: {e}")
+                    continue
 
                 info = {
                     "session_id": session_data.get("session_id"),
@@ -169,9 +345,21 @@ class ConversationMemory:
                 }
                 session_info.append(info)
 
-            except Exception as e:
-                print(f"Error reading session file {session_file}: {e}")
-                continue
+                cache[entry.name] = {"mtime": mtime, "info": info}
+                dirty = True
+
+        # Drop cache entries for deleted session files
+        stale = cache.keys() - seen
+        if stale:
+            for name in stale:
+                del cache[name]
+            dirty = True
+
+        if dirty:
+            try:
+                cache_path.write_bytes(_dumps(cache))
+            except OSError:
+                pass
 
         # Sort by update time, most recent first
         session_info.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
@@ -215,22 +403,24 @@ class ConversationMemory:
         Returns:
             Number of sessions deleted
         """
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-        session_files = list(self.session_store_path.glob("*.json"))
+        cutoff_timestamp = (datetime.now() - timedelta(days=days_old)).timestamp()
         deleted_count = 0
 
-        for session_file in session_files:
-            try:
-                # Check file modification time
-                file_time = datetime.fromtimestamp(session_file.stat().st_mtime)
+        # scandir caches stat results from the directory read, so each file
+        # costs one syscall instead of a glob plus a separate stat
+        with os.scandir(self.session_store_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or entry.name == _LISTING_CACHE_NAME:
+                    continue
 
-                if file_time < cutoff_date:
-                    session_file.unlink()
-                    deleted_count += 1
+                try:
+                    if entry.stat().st_mtime < cutoff_timestamp:
+                        os.unlink(entry.path)
+                        deleted_count += 1
 
-            except Exception as e:
-                print(f"Error processing session file {session_file}: {e}")
-                continue
+                except Exception as e:
+                    print(f"Error processing session file {entry.path}: {e}")
+                    continue
 
         return deleted_count
 
@@ -257,7 +447,7 @@ class ConversationMemory:
         if self.current_session is None:
             return {"status": "no_active_session"}
 
-        messages = self.current_session.messages
+        messages = self._messages
         user_messages = [msg for msg in messages if msg.role == "user"]
         assistant_messages = [msg for msg in messages if msg.role == "assistant"]
 
@@ -271,32 +461,17 @@ class ConversationMemory:
             "duration_minutes": self._calculate_session_duration()
         }
 
-    def _trim_history(self) -> None:
-        """Trim conversation history to stay within max_history limit."""
-        if self.current_session is None:
-            return
-
-        if len(self.current_session.messages) > self.max_history:
-            # Keep the most recent messages
-            self.current_session.messages = self.current_session.messages[-self.max_history:]
-
     def _get_last_message_preview(self, messages: List[Dict]) -> str:
         """Get a preview of the last message for session listing."""
         if not messages:
             return "No messages"
 
-        last_message = messages[-1]
-        content = last_message.get("content", "")
-
-        # Truncate if too long
-        if len(content) > 100:
-            content = content[:97] + "..."
-
-        return content
+        content = messages[-1].get("content", "") or ""
+        return content if len(content) <= 100 else content[:97] + "..."
 
     def _calculate_session_duration(self) -> float:
         """Calculate session duration in minutes."""
-        if self.current_session is None or not self.current_session.messages:
+        if self.current_session is None or not self._messages:
             return 0.0
 
         start_time = self.current_session.created_at
@@ -8,19 +8,37 @@ for type safety and data validation.
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import (BaseModel, ConfigDict, Field, field_serializer,
+                      field_validator)
 
 
 class ConversationChunk(BaseModel):
     """Represents a semantically meaningful conversation segment."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: str = Field(..., description="Unique identifier for the chunk")
     speaker: str = Field(..., description="Speaker name (Alex, John, etc.)")
     content: str = Field(..., description="Actual conversation content")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional context")
     timestamp: Optional[datetime] = Field(None, description="When this was said")
     file_source: str = Field(..., description="Source conversation file")
-    embedding: Optional[List[float]] = Field(None, description="OpenAI embedding vector")
+    file_path: str = Field("", description="Full path to the source file")
+    parsed_at: Optional[str] = Field(None, description="When this chunk was parsed")
+    embedding: Optional[np.ndarray] = Field(None, description="OpenAI embedding vector (float32)")
+
+    @field_validator('embedding', mode='before')
+    @classmethod
+    def _coerce_embedding(cls, value: Any) -> Optional[np.ndarray]:
+        """Keep embeddings as contiguous float32 arrays, not boxed floats."""
+        if value is None:
+            return None
+        return np.asarray(value, dtype=np.float32)
+
+    @field_serializer('embedding')
+    def _serialize_embedding(self, value: Optional[np.ndarray]) -> Optional[List[float]]:
+        """Serialize the embedding back to a plain list for JSON output."""
+        return value.tolist() if value is not None else None
 
 
 class PersonaContext(BaseModel):
@@ -33,6 +51,11 @@ class PersonaContext(BaseModel):
     relevant_chunks: List[ConversationChunk] = Field(default_factory=list)
 
 
+# Shared empty context for error/fallback paths; treat as read-only and
+# model_copy() before any mutation.
+EMPTY_PERSONA_CONTEXT = PersonaContext()
+
+
 class ChatMessage(BaseModel):
     """Single message in ongoing conversation."""
 
@@ -57,6 +80,7 @@ class ConversationState(BaseModel):
     messages: List[Dict[str, str]] = Field(default_factory=list)
     query: str = Field("", description="Current user query")
     retrieved_context: List[ConversationChunk] = Field(default_factory=list)
+    conversation_history: List[Dict[str, str]] = Field(default_factory=list)
     persona_analysis: Optional[PersonaContext] = Field(None)
     response: str = Field("", description="Generated response")
     error: Optional[str] = Field(None, description="Error message if any")
@@ -6,18 +6,91 @@ using OpenAI embeddings and FAISS for efficient retrieval.
 """
 
 import asyncio
-import pickle
+import hashlib
+import re
+import sqlite3
+from collections import OrderedDict
+from datetime import datetime
 from typing import Dict, List, Optional
 
 import faiss
 import numpy as np
 from openai import AsyncOpenAI
 
-from .config import config
+from .config import get_config
 from .models import ConversationChunk, PersonaContext
 from .utils import (chunk_text_by_tokens, extract_alex_communication_patterns,
-                    is_alex_speaker, load_conversation_files,
-                    parse_markdown_conversation)
+                    is_alex_speaker, json_dumps, json_loads,
+                    load_conversation_files, parse_markdown_conversations_batch)
+
+# Embedding request batching for vector store builds
+_EMBED_BATCH_SIZE = 256
+_EMBED_MAX_CONCURRENCY = 4
+
+# Bound on the exact-match embedding cache
+_EMBEDDING_CACHE_MAX = 10000
+
+# Flush pending on-disk embedding cache inserts after this many writes
+_EMBEDDING_DB_COMMIT_EVERY = 32
+
+# HNSW graph parameters: sublinear search with near-exact recall at k=5
+_HNSW_NEIGHBORS = 32
+_HNSW_EF_CONSTRUCTION = 200
+_HNSW_EF_SEARCH = 64
+
+
+def _compile_keyword_scanner(rules):
+    """
+    Build a multi-pattern scanner for persona keyword extraction.
+
+    Returns a compiled regex that finds every rule keyword (including
+    overlapping occurrences) in one pass, plus a mapping from keyword to
+    the labels it triggers. A keyword that contains a shorter keyword also
+    inherits its labels, preserving the old per-term substring semantics.
+
+    Args:
+        rules: List of (keywords, label) pairs
+
+    Returns:
+        Tuple of (compiled pattern, keyword -> label set mapping)
+    """
+    labels_by_keyword = {}
+    for keywords, label in rules:
+        for keyword in keywords:
+            labels_by_keyword.setdefault(keyword, set()).add(label)
+
+    for keyword, labels in labels_by_keyword.items():
+        for other, other_labels in labels_by_keyword.items():
+            if other is not keyword and other in keyword:
+                labels.update(other_labels)
+
+    pattern = re.compile('(?=(' + '|'.join(
+        re.escape(keyword)
+        for keyword in sorted(labels_by_keyword, key=len, reverse=True)
+    ) + '))')
+
+    return pattern, labels_by_keyword
+
+
+_DETAIL_TRAIT = "Detail-oriented and thorough"
+
+# One scanner covers all persona categories, so each retrieval batch is
+# scanned once; labels are (category, text) pairs split apart afterwards
+_PERSONA_SCANNER = _compile_keyword_scanner([
+    (['ai', 'rag', 'llm', 'openai', 'azure', 'agentic'], ('technical', "AI/ML and RAG platforms")),
+    (['platform', 'api', 'service', 'architecture'], ('technical', "Platform engineering and architecture")),
+    (['microsoft', 'azure', 'teams', '.net'], ('technical', "Microsoft ecosystem and Azure")),
+    (['team', 'engineer', 'developer', 'productivity'], ('technical', "Engineering team leadership")),
+    (['ci/cd', 'deployment', 'devops', 'pipeline'], ('technical', "DevOps and continuous deployment")),
+    (['metric', 'data', 'measure', 'quantify'], ('decision', "Data-driven and metrics-focused decision making")),
+    (['collaborate', 'partner', 'stakeholder', 'team'], ('decision', "Collaborative and stakeholder-inclusive approach")),
+    (['user', 'customer', 'experience', 'productivity'], ('decision', "User-centric and experience-focused")),
+    (['strategy', 'roadmap', 'vision', 'long-term'], ('decision', "Strategic and long-term thinking")),
+    (['specific', 'detail', 'example'], ('personality', _DETAIL_TRAIT)),
+    (['mission', 'purpose', 'goal', 'impact'], ('personality', "Mission-driven and impact-focused")),
+    (['mentor', 'promote', 'support', 'inclusive'], ('personality', "Inclusive and development-focused leader")),
+    (['innovation', 'new', 'advance', 'cutting-edge'], ('personality', "Innovation-minded and forward-thinking")),
+])
 
 
 class ConversationRAG:
@@ -30,17 +103,26 @@ class ConversationRAG:
         Args:
             openai_client: Optional OpenAI client, uses config default if None
         """
+        config = get_config()
         self.client = openai_client or config.get_openai_client()
         self.vector_store_path = config.vector_store_path
         self.conversation_path = config.conversation_data_path
 
         # Vector store components
-        self.index: Optional[faiss.IndexFlatIP] = None
+        self.index: Optional[faiss.Index] = None
         self.chunks: List[ConversationChunk] = []
-        self.chunk_map: Dict[int, ConversationChunk] = {}
 
-        # Cache for embeddings to avoid re-computation
-        self._embedding_cache: Dict[str, List[float]] = {}
+        # Stored chunk embeddings, mmap-backed after a load from disk
+        self._embeddings: Optional[np.ndarray] = None
+
+        # LRU cache of embeddings keyed by content digest, backed by an
+        # on-disk store so restarts don't re-pay the API cost
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._embedding_db = self._open_embedding_db()
+        self._pending_db_writes = 0
+
+        # Lazily built FAISS selector restricting search to Alex's chunks
+        self._alex_selector: Optional[faiss.IDSelectorBatch] = None
 
     async def initialize(self, force_rebuild: bool = False) -> None:
         """
@@ -54,13 +136,26 @@ class ConversationRAG:
         else:
             await self._load_vector_store()
 
-    async def similarity_search(self, query: str, k: int = 5) -> List[ConversationChunk]:
+    def _get_alex_selector(self) -> Optional[faiss.IDSelectorBatch]:
+        """Get (building if needed) the FAISS selector for Alex's chunk ids."""
+        if self._alex_selector is None and self.chunks:
+            alex_ids = np.array(
+                [i for i, chunk in enumerate(self.chunks) if is_alex_speaker(chunk.speaker)],
+                dtype=np.int64
+            )
+            if len(alex_ids) == 0:
+                return None
+            self._alex_selector = faiss.IDSelectorBatch(alex_ids)
+        return self._alex_selector
+
+    async def similarity_search(self, query: str, k: int = 5, alex_only: bool = False) -> List[ConversationChunk]:
         """
         Perform similarity search to find relevant conversation chunks.
 
         Args:
             query: Search query
             k: Number of results to return
+            alex_only: If True, restrict the search to Alex's chunks
 
         Returns:
             List of most relevant ConversationChunk objects
@@ -71,16 +166,68 @@ class ConversationRAG:
         # Generate embedding for the query
         query_embedding = await self._get_embedding(query)
 
-        # Perform similarity search
-        query_vector = np.array([query_embedding], dtype=np.float32)
-        scores, indices = self.index.search(query_vector, min(k, len(self.chunks)))
+        # Perform similarity search, filtered in-index when requested.
+        # Stored vectors are L2-normalized, so the query must be too for
+        # inner-product scores to be true cosine similarities.
+        query_vector = np.ascontiguousarray(
+            np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+        )
+        faiss.normalize_L2(query_vector)
+        search_kwargs = {}
+        if alex_only:
+            selector = self._get_alex_selector()
+            if selector is not None:
+                search_kwargs["params"] = faiss.SearchParametersHNSW(
+                    sel=selector, efSearch=_HNSW_EF_SEARCH
+                )
+        scores, indices = self.index.search(query_vector, min(k, len(self.chunks)), **search_kwargs)
 
         # Return corresponding chunks
         results = []
         for score, idx in zip(scores[0], indices[0]):
-            if idx in self.chunk_map and score > 0.1:  # Minimum similarity threshold
-                chunk = self.chunk_map[idx]
-                results.append(chunk)
+            if 0 <= idx < len(self.chunks) and score > 0.1:  # Minimum similarity threshold
+                results.append(self.chunks[idx])
+
+        return results
+
+    async def batch_similarity_search(self, queries: List[str], k: int = 5, alex_only: bool = False) -> List[List[ConversationChunk]]:
+        """
+        Perform similarity search for several queries with one FAISS call.
+
+        Args:
+            queries: Search queries
+            k: Number of results to return per query
+            alex_only: If True, restrict the search to Alex's chunks
+
+        Returns:
+            List of chunk lists, one per query in input order
+        """
+        if self.index is None or not self.chunks:
+            await self.initialize()
+
+        # Generate embeddings for all queries concurrently
+        embeddings = await asyncio.gather(*(self._get_embedding(query) for query in queries))
+
+        # Single batched search lets FAISS vectorize across query rows;
+        # normalize to match the L2-normalized stored vectors
+        query_matrix = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+        faiss.normalize_L2(query_matrix)
+        search_kwargs = {}
+        if alex_only:
+            selector = self._get_alex_selector()
+            if selector is not None:
+                search_kwargs["params"] = faiss.SearchParametersHNSW(
+                    sel=selector, efSearch=_HNSW_EF_SEARCH
+                )
+        scores, indices = self.index.search(query_matrix, min(k, len(self.chunks)), **search_kwargs)
+
+        results = []
+        for row_scores, row_indices in zip(scores, indices):
+            results.append([
+                self.chunks[idx]
+                for score, idx in zip(row_scores, row_indices)
+                if 0 <= idx < len(self.chunks) and score > 0.1  # Minimum similarity threshold
+            ])
 
         return results
 
@@ -100,75 +247,87 @@ class ConversationRAG:
         # Extract communication patterns
         communication_patterns = extract_alex_communication_patterns(alex_chunks)
 
-        # Extract technical expertise areas
-        technical_expertise = self._extract_technical_expertise(alex_chunks)
-
-        # Extract decision patterns
-        decision_patterns = self._extract_decision_patterns(alex_chunks)
-
-        # Extract personality traits
-        personality_traits = self._extract_personality_traits(alex_chunks)
+        # Lowercase each chunk once and extract every category in one scan
+        lowered_contents = [chunk.content.lower() for chunk in alex_chunks]
+        extracted = self._extract_all(lowered_contents)
 
         return PersonaContext(
             communication_style=communication_patterns,
-            technical_expertise=technical_expertise,
-            decision_patterns=decision_patterns,
-            personality_traits=personality_traits,
+            technical_expertise=extracted['technical'],
+            decision_patterns=extracted['decision'],
+            personality_traits=extracted['personality'],
             relevant_chunks=alex_chunks
         )
 
     async def _build_vector_store(self) -> None:
         """Build the vector store from conversation files."""
+        config = get_config()
         print("Building vector store from conversations...")
 
-        # Parse all conversation files
+        # Parse conversation files off the event loop; the batch helper
+        # fans CPU-bound parsing out across worker processes
         conversation_files = load_conversation_files(self.conversation_path)
-        all_chunks = []
-
-        for file_path in conversation_files:
-            chunks = parse_markdown_conversation(file_path)
-            all_chunks.extend(chunks)
+        all_chunks = await asyncio.to_thread(
+            parse_markdown_conversations_batch, conversation_files
+        )
 
         print(f"Parsed {len(all_chunks)} conversation chunks from {len(conversation_files)} files")
 
-        # Generate embeddings for all chunks
+        # Pair every text segment with its parent chunk before embedding
+        pairs = []
+        for chunk in all_chunks:
+            # Process content in smaller pieces if needed
+            text_chunks = chunk_text_by_tokens(chunk.content, config.chunk_size,
+                                               config.chunk_overlap)
+            for text_chunk in text_chunks:
+                pairs.append((chunk, text_chunk))
+
+        # Embed whole batches per request; the semaphore bounds concurrency
+        semaphore = asyncio.Semaphore(_EMBED_MAX_CONCURRENCY)
+
+        async def embed_batch(texts: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._get_embeddings_batch(texts)
+
+        batches = [pairs[i:i + _EMBED_BATCH_SIZE] for i in range(0, len(pairs), _EMBED_BATCH_SIZE)]
+        batch_results = await asyncio.gather(
+            *(embed_batch([text for _, text in batch]) for batch in batches),
+            return_exceptions=True
+        )
+
         embeddings = []
         valid_chunks = []
 
-        for i, chunk in enumerate(all_chunks):
-            # Process content in smaller pieces if needed
-            text_chunks = chunk_text_by_tokens(chunk.content, config.chunk_size, config.chunk_overlap)
-
-            for text_chunk in text_chunks:
-                try:
-                    embedding = await self._get_embedding(text_chunk)
-                    embeddings.append(embedding)
-
-                    # Create a new chunk for each text segment
-                    chunk_copy = ConversationChunk(
-                        id=f"{chunk.id}_{len(valid_chunks)}",
-                        speaker=chunk.speaker,
-                        content=text_chunk,
-                        metadata=chunk.metadata,
-                        timestamp=chunk.timestamp,
-                        file_source=chunk.file_source,
-                        embedding=embedding
-                    )
-                    valid_chunks.append(chunk_copy)
-
-                    # Rate limiting - small delay between API calls
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
-                    print(f"Error generating embedding for chunk {chunk.id}: {e}")
-                    continue
+        for batch, result in zip(batches, batch_results):
+            if isinstance(result, BaseException):
+                print(f"Error generating embeddings for batch of {len(batch)} segments: {result}")
+                continue
+
+            for (chunk, text_chunk), embedding in zip(batch, result):
+                embeddings.append(embedding)
+
+                # Create a new chunk for each text segment
+                chunk_copy = ConversationChunk(
+                    id=f"{chunk.id}_{len(valid_chunks)}",
+                    speaker=chunk.speaker,
+                    content=text_chunk,
+                    timestamp=chunk.timestamp,
+                    file_source=chunk.file_source,
+                    file_path=chunk.file_path,
+                    parsed_at=chunk.parsed_at,
+                    embedding=embedding
+                )
+                valid_chunks.append(chunk_copy)
 
         if not embeddings:
             raise ValueError("No valid embeddings generated")
 
-        # Create FAISS index
+        # Create FAISS index; HNSW searches the graph instead of scanning
+        # every vector, keeping queries sublinear as the corpus grows
         embedding_dim = len(embeddings[0])
-        self.index = faiss.IndexFlatIP(embedding_dim)  # Inner product for cosine similarity
+        self.index = faiss.IndexHNSWFlat(embedding_dim, _HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT)
+        self.index.hnsw.efConstruction = _HNSW_EF_CONSTRUCTION
+        self.index.hnsw.efSearch = _HNSW_EF_SEARCH
 
         # Normalize embeddings for cosine similarity
         embeddings_array = np.array(embeddings, dtype=np.float32)
@@ -177,9 +336,9 @@ class ConversationRAG:
         # Add to index
         self.index.add(embeddings_array)
 
-        # Store chunks and mapping
+        # Store chunks; FAISS row ids index straight into this list
         self.chunks = valid_chunks
-        self.chunk_map = {i: chunk for i, chunk in enumerate(valid_chunks)}
+        self._alex_selector = None  # Chunk ids changed
 
         # Save vector store
         await self._save_vector_store()
@@ -187,34 +346,38 @@ class ConversationRAG:
         print(f"Vector store built with {len(valid_chunks)} chunks")
 
     async def _save_vector_store(self) -> None:
-        """Save the vector store to disk."""
+        """Save the vector store to disk in a worker thread."""
+        await asyncio.to_thread(self._write_vector_store)
+        print(f"Vector store saved to {self.vector_store_path}")
+
+    def _write_vector_store(self) -> None:
+        """Write the index, chunk metadata and embeddings (blocking)."""
         # Save FAISS index
         index_path = self.vector_store_path / "index.faiss"
         faiss.write_index(self.index, str(index_path))
 
-        # Save chunks and metadata
-        chunks_path = self.vector_store_path / "chunks.pkl"
-        with open(chunks_path, 'wb') as f:
-            pickle.dump({
-                'chunks': self.chunks,
-                'chunk_map': self.chunk_map
-            }, f)
+        # Chunk metadata goes to JSON; embeddings to one contiguous float32
+        # array, which loads back as an mmap instead of per-float objects
+        meta_path = self.vector_store_path / "chunks_meta.json"
+        meta_path.write_bytes(
+            json_dumps([chunk.model_dump(exclude={'embedding'}) for chunk in self.chunks])
+        )
 
-        print(f"Vector store saved to {self.vector_store_path}")
+        if self.chunks and self.chunks[0].embedding is not None:
+            embeddings_array = np.asarray(
+                [chunk.embedding for chunk in self.chunks], dtype=np.float32
+            )
+        else:
+            embeddings_array = np.asarray(self._embeddings, dtype=np.float32)
+        np.save(self.vector_store_path / "embeddings.npy", embeddings_array)
 
     async def _load_vector_store(self) -> None:
-        """Load the vector store from disk."""
+        """Load the vector store from disk in a worker thread."""
         try:
-            # Load FAISS index
-            index_path = self.vector_store_path / "index.faiss"
-            self.index = faiss.read_index(str(index_path))
-
-            # Load chunks and metadata
-            chunks_path = self.vector_store_path / "chunks.pkl"
-            with open(chunks_path, 'rb') as f:
-                data = pickle.load(f)
-                self.chunks = data['chunks']
-                self.chunk_map = data['chunk_map']
+            self.index, self.chunks, self._embeddings = await asyncio.to_thread(
+                self._read_vector_store
+            )
+            self._alex_selector = None  # Chunk ids changed
 
             print(f"Vector store loaded with {len(self.chunks)} chunks")
 
@@ -222,13 +385,71 @@ class ConversationRAG:
             print(f"Error loading vector store: {e}")
             await self._build_vector_store()
 
+    def _read_vector_store(self):
+        """Read the index, chunk metadata and embeddings (blocking)."""
+        index_path = self.vector_store_path / "index.faiss"
+        index = faiss.read_index(str(index_path))
+        if hasattr(index, 'hnsw'):
+            index.hnsw.efSearch = _HNSW_EF_SEARCH
+
+        # Load chunk metadata; embeddings stay in the mmapped array and
+        # are not re-attached to the chunk models. The metadata was written
+        # by _write_vector_store, so skip Pydantic revalidation.
+        meta_path = self.vector_store_path / "chunks_meta.json"
+        chunks = [
+            ConversationChunk.model_construct(**{
+                **chunk_data,
+                "timestamp": (
+                    datetime.fromisoformat(chunk_data["timestamp"])
+                    if isinstance(chunk_data.get("timestamp"), str) else None
+                )
+            })
+            for chunk_data in json_loads(meta_path.read_bytes())
+        ]
+        embeddings = np.load(self.vector_store_path / "embeddings.npy", mmap_mode='r')
+        return index, chunks, embeddings
+
     def _vector_store_exists(self) -> bool:
         """Check if vector store files exist."""
         index_path = self.vector_store_path / "index.faiss"
-        chunks_path = self.vector_store_path / "chunks.pkl"
-        return index_path.exists() and chunks_path.exists()
+        meta_path = self.vector_store_path / "chunks_meta.json"
+        embeddings_path = self.vector_store_path / "embeddings.npy"
+        return index_path.exists() and meta_path.exists() and embeddings_path.exists()
 
-    async def _get_embedding(self, text: str) -> List[float]:
+    def _open_embedding_db(self) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the persistent embedding cache."""
+        try:
+            conn = sqlite3.connect(
+                self.vector_store_path / "embedding_cache.sqlite",
+                check_same_thread=False
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, vec BLOB)")
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            print(f"Error opening embedding cache: {e}")
+            return None
+
+    def _cache_embedding(self, cache_key: bytes, embedding: np.ndarray) -> None:
+        """Store an embedding in the in-memory LRU and the on-disk cache."""
+        self._embedding_cache[cache_key] = embedding
+        while len(self._embedding_cache) > _EMBEDDING_CACHE_MAX:
+            self._embedding_cache.popitem(last=False)
+
+        if self._embedding_db is not None:
+            try:
+                self._embedding_db.execute(
+                    "INSERT OR IGNORE INTO cache VALUES (?, ?)",
+                    (cache_key, embedding.tobytes())
+                )
+                self._pending_db_writes += 1
+                if self._pending_db_writes >= _EMBEDDING_DB_COMMIT_EVERY:
+                    self._embedding_db.commit()
+                    self._pending_db_writes = 0
+            except sqlite3.Error as e:
+                print(f"Error writing embedding cache: {e}")
+
+    async def _get_embedding(self, text: str) -> np.ndarray:
         """
         Get embedding for text with caching.
 
@@ -236,22 +457,38 @@ class ConversationRAG:
             text: Text to embed
 
         Returns:
-            Embedding vector
+            Embedding vector as a float32 array
         """
-        # Check cache first
-        cache_key = text[:100]  # Use first 100 chars as cache key
-        if cache_key in self._embedding_cache:
-            return self._embedding_cache[cache_key]
+        # Check cache first; the digest keys the full text, so distinct
+        # texts sharing a prefix can no longer collide
+        cache_key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        cached = self._embedding_cache.get(cache_key)
+        if cached is not None:
+            self._embedding_cache.move_to_end(cache_key)
+            return cached
+
+        # Then the on-disk cache, populated by previous runs
+        if self._embedding_db is not None:
+            row = self._embedding_db.execute(
+                "SELECT vec FROM cache WHERE key = ?", (cache_key,)
+            ).fetchone()
+            if row is not None:
+                # Copy off the immutable bytes row so the array is writable
+                embedding = np.frombuffer(row[0], dtype=np.float32).copy()
+                self._embedding_cache[cache_key] = embedding
+                while len(self._embedding_cache) > _EMBEDDING_CACHE_MAX:
+                    self._embedding_cache.popitem(last=False)
+                return embedding
 
         try:
             response = await self.client.embeddings.create(
-                model=config.embedding_model,
+                model=get_config().embedding_model,
                 input=text
             )
-            embedding = response.data[0].embedding
+            embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
 
-            # Cache the result
-            self._embedding_cache[cache_key] = embedding
+            # Cache the result in memory and on disk
+            self._cache_embedding(cache_key, embedding)
 
             return embedding
 
@@ -259,81 +496,69 @@ class ConversationRAG:
             print(f"Error generating embedding: {e}")
             raise
 
-    def _extract_technical_expertise(self, chunks: List[ConversationChunk]) -> List[str]:
-        """Extract technical expertise areas from Alex's chunks."""
-        expertise_areas = set()
-
-        for chunk in chunks:
-            content_lower = chunk.content.lower()
-
-            # AI/ML expertise
-            if any(term in content_lower for term in ['ai', 'rag', 'llm', 'openai', 'azure', 'agentic']):
-                expertise_areas.add("AI/ML and RAG platforms")
-
-            # Platform engineering
-            if any(term in content_lower for term in ['platform', 'api', 'service', 'architecture']):
-                expertise_areas.add("Platform engineering and architecture")
-
-            # Microsoft ecosystem
-            if any(term in content_lower for term in ['microsoft', 'azure', 'teams', '.net']):
-                expertise_areas.add("Microsoft ecosystem and Azure")
-
-            # Engineering leadership
-            if any(term in content_lower for term in ['team', 'engineer', 'developer', 'productivity']):
-                expertise_areas.add("Engineering team leadership")
-
-            # DevOps and CI/CD
-            if any(term in content_lower for term in ['ci/cd', 'deployment', 'devops', 'pipeline']):
-                expertise_areas.add("DevOps and continuous deployment")
-
-        return list(expertise_areas)
-
-    def _extract_decision_patterns(self, chunks: List[ConversationChunk]) -> List[str]:
-        """Extract decision-making patterns from Alex's chunks."""
-        patterns = set()
-
-        for chunk in chunks:
-            content_lower = chunk.content.lower()
-
-            # Data-driven decisions
-            if any(term in content_lower for term in ['metric', 'data', 'measure', 'quantify']):
-                patterns.add("Data-driven and metrics-focused decision making")
-
-            # Collaborative approach
-            if any(term in content_lower for term in ['collaborate', 'partner', 'stakeholder', 'team']):
-                patterns.add("Collaborative and stakeholder-inclusive approach")
-
-            # User-centric
-            if any(term in content_lower for term in ['user', 'customer', 'experience', 'productivity']):
-                patterns.add("User-centric and experience-focused")
-
-            # Strategic thinking
-            if any(term in content_lower for term in ['strategy', 'roadmap', 'vision', 'long-term']):
-                patterns.add("Strategic and long-term thinking")
+    async def _get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Get embeddings for several texts with a single API call.
 
-        return list(patterns)
+        Args:
+            texts: Texts to embed
 
-    def _extract_personality_traits(self, chunks: List[ConversationChunk]) -> List[str]:
-        """Extract personality traits from Alex's chunks."""
-        traits = set()
+        Returns:
+            One float32 embedding array per input text, in input order
+        """
+        response = await self.client.embeddings.create(
+            model=get_config().embedding_model,
+            input=texts
+        )
+        embeddings = [np.asarray(item.embedding, dtype=np.float32) for item in response.data]
 
-        for chunk in chunks:
-            content_lower = chunk.content.lower()
+        # Warm both cache tiers so later lookups skip the API
+        for text, embedding in zip(texts, embeddings):
+            cache_key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+            self._cache_embedding(cache_key, embedding)
 
-            # Detail-oriented
-            if len(chunk.content) > 200 and any(term in content_lower for term in ['specific', 'detail', 'example']):
-                traits.add("Detail-oriented and thorough")
+        return embeddings
 
-            # Mission-driven
-            if any(term in content_lower for term in ['mission', 'purpose', 'goal', 'impact']):
-                traits.add("Mission-driven and impact-focused")
+    def _extract_all(self, lowered_contents: List[str]) -> Dict[str, List[str]]:
+        """
+        Extract every persona category from lowercased chunk contents.
 
-            # Inclusive leadership
-            if any(term in content_lower for term in ['mentor', 'promote', 'support', 'inclusive']):
-                traits.add("Inclusive and development-focused leader")
+        The whole batch is joined and scanned in one C-level regex pass;
+        keywords never span the newline separator, so joining cannot
+        create false matches.
 
-            # Innovation-minded
-            if any(term in content_lower for term in ['innovation', 'new', 'advance', 'cutting-edge']):
-                traits.add("Innovation-minded and forward-thinking")
+        Args:
+            lowered_contents: Lowercased chunk contents
 
-        return list(traits)
+        Returns:
+            Mapping of category name to extracted label list
+        """
+        pattern, labels_by_keyword = _PERSONA_SCANNER
+        found = {'technical': set(), 'decision': set(), 'personality': set()}
+
+        for match in pattern.finditer('\n'.join(lowered_contents)):
+            for category, label in labels_by_keyword[match.group(1)]:
+                found[category].add(label)
+
+        # The detail-oriented trait additionally requires a long chunk;
+        # re-check it against long chunks only when the batch scan found it
+        if _DETAIL_TRAIT in found['personality'] and not any(
+            ('personality', _DETAIL_TRAIT) in labels_by_keyword[match.group(1)]
+            for content in lowered_contents if len(content) > 200
+            for match in pattern.finditer(content)
+        ):
+            found['personality'].discard(_DETAIL_TRAIT)
+
+        return {category: list(labels) for category, labels in found.items()}
+
+    def _extract_technical_expertise(self, lowered_contents: List[str]) -> List[str]:
+        """Extract technical expertise areas from lowercased chunk contents."""
+        return self._extract_all(lowered_contents)['technical']
+
+    def _extract_decision_patterns(self, lowered_contents: List[str]) -> List[str]:
+        """Extract decision-making patterns from lowercased chunk contents."""
+        return self._extract_all(lowered_contents)['decision']
+
+    def _extract_personality_traits(self, lowered_contents: List[str]) -> List[str]:
+        """Extract personality traits from lowercased chunk contents."""
+        return self._extract_all(lowered_contents)['personality']
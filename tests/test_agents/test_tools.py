@@ -0,0 +1,258 @@
+"""
+Tests for Alex Persona agent tools.
+
+Tests the proximity cache, query batching, and trivial-query gating
+used by the retrieval toolkit.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, call, patch
+
+import numpy as np
+import pytest
+
+from src.agents.alex_persona.tools import (AlexPersonaToolkit,
+                                           BatchingRAGRetrievalTool,
+                                           ProximityCache, RAGRetrievalTool)
+from src.core.models import ConversationChunk
+
+
+def _make_chunk(chunk_id: str) -> ConversationChunk:
+    """Create a minimal conversation chunk for retrieval payloads."""
+    return ConversationChunk(
+        id=chunk_id,
+        speaker="Alex",
+        content=f"Test content {chunk_id}",
+        file_source="test.md"
+    )
+
+
+def _unit_vector(axis: int, dim: int = 8) -> np.ndarray:
+    """Create a normalized embedding pointing along one axis."""
+    vector = np.zeros(dim, dtype=np.float32)
+    vector[axis] = 1.0
+    return vector
+
+
+class TestProximityCache:
+    """Test the approximate semantic cache for retrieval results."""
+
+    def test_lookup_hit_within_tau(self):
+        """Test that close paraphrases of a cached query hit the cache."""
+        cache = ProximityCache(capacity=4, tau=0.05)
+        embedding = _unit_vector(0)
+        chunks = [_make_chunk("a")]
+
+        cache.store(embedding, 5, False, chunks)
+
+        # The exact embedding hits
+        assert cache.lookup(embedding, 5, alex_only=False) == chunks
+
+        # A slightly rotated query still lands within tau
+        near = embedding.copy()
+        near[1] = 0.1
+        near /= np.linalg.norm(near)
+        assert cache.lookup(near, 5, alex_only=False) == chunks
+
+    def test_lookup_miss_beyond_tau(self):
+        """Test that dissimilar queries miss the cache."""
+        cache = ProximityCache(capacity=4, tau=0.05)
+        cache.store(_unit_vector(0), 5, False, [_make_chunk("a")])
+
+        assert cache.lookup(_unit_vector(1), 5, alex_only=False) is None
+
+    def test_filter_and_k_must_match(self):
+        """Test that the speaker filter and requested k gate cache hits."""
+        cache = ProximityCache(capacity=4, tau=0.05)
+        embedding = _unit_vector(0)
+        chunks = [_make_chunk(str(i)) for i in range(5)]
+
+        cache.store(embedding, 5, False, chunks)
+
+        # A different speaker filter can't reuse the results
+        assert cache.lookup(embedding, 5, alex_only=True) is None
+
+        # More chunks than were cached can't be served
+        assert cache.lookup(embedding, 7, alex_only=False) is None
+
+        # Fewer chunks are served as a prefix of the cached results
+        assert cache.lookup(embedding, 3, alex_only=False) == chunks[:3]
+
+    def test_lru_eviction_at_capacity(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = ProximityCache(capacity=2, tau=0.05)
+        first, second, third = (_unit_vector(axis) for axis in range(3))
+
+        cache.store(first, 5, False, [_make_chunk("first")])
+        cache.store(second, 5, False, [_make_chunk("second")])
+
+        # Touch the first entry so the second becomes LRU
+        assert cache.lookup(first, 5, alex_only=False) is not None
+
+        cache.store(third, 5, False, [_make_chunk("third")])
+
+        assert cache.lookup(second, 5, alex_only=False) is None
+        assert cache.lookup(first, 5, alex_only=False) is not None
+        assert cache.lookup(third, 5, alex_only=False) is not None
+
+    def test_clear_drops_entries(self):
+        """Test that clear empties the cache."""
+        cache = ProximityCache(capacity=4, tau=0.05)
+        embedding = _unit_vector(0)
+
+        cache.store(embedding, 5, False, [_make_chunk("a")])
+        cache.clear()
+
+        assert cache.lookup(embedding, 5, alex_only=False) is None
+
+
+class TestRAGRetrievalToolCaching:
+    """Test proximity-cache integration in the retrieval tool."""
+
+    @pytest.fixture
+    def retrieval_tool(self):
+        """Create a retrieval tool over a mocked RAG system."""
+        with patch('src.agents.alex_persona.tools.get_config') as mock_get_config:
+            mock_config = mock_get_config.return_value
+            mock_config.rag_cache_size = 16
+            mock_config.rag_cache_tau = 0.05
+
+            rag_system = Mock()
+            rag_system._get_embedding = AsyncMock(return_value=_unit_vector(0))
+            rag_system.similarity_search = AsyncMock(return_value=[_make_chunk("hit")])
+            return RAGRetrievalTool(rag_system)
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_skips_search(self, retrieval_tool):
+        """Test that a repeated query is served from the proximity cache."""
+        first = await retrieval_tool.retrieve_context("platform work", k=1)
+        second = await retrieval_tool.retrieve_context("platform work", k=1)
+
+        assert first == second
+        assert retrieval_tool.rag_system.similarity_search.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_filter_change_bypasses_cache(self, retrieval_tool):
+        """Test that changing the speaker filter re-runs the search."""
+        await retrieval_tool.retrieve_context("platform work", k=1)
+        await retrieval_tool.retrieve_context("platform work", k=1, alex_only=True)
+
+        assert retrieval_tool.rag_system.similarity_search.call_count == 2
+
+
+class TestBatchingRAGRetrievalTool:
+    """Test coalescing of concurrent queries into batched searches."""
+
+    @pytest.fixture
+    def batching_tool(self):
+        """Create a batching retrieval tool over a mocked RAG system."""
+        with patch('src.agents.alex_persona.tools.get_config') as mock_get_config:
+            mock_config = mock_get_config.return_value
+            mock_config.rag_cache_size = 16
+            mock_config.rag_cache_tau = 0.05
+            mock_config.rag_batch_size = 8
+            mock_config.rag_batch_window_ms = 5.0
+
+            rag_system = Mock()
+            rag_system.batch_similarity_search = AsyncMock()
+            return BatchingRAGRetrievalTool(rag_system)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_search(self, batching_tool):
+        """Test that queries inside the window dispatch as a single batch."""
+        async def fake_batch(queries, k=5, alex_only=False):
+            return [[_make_chunk(query)] for query in queries]
+
+        batching_tool.rag_system.batch_similarity_search.side_effect = fake_batch
+
+        first, second = await asyncio.gather(
+            batching_tool._search("query one", 3),
+            batching_tool._search("query two", 3)
+        )
+
+        batching_tool.rag_system.batch_similarity_search.assert_called_once_with(
+            ["query one", "query two"], k=3, alex_only=False
+        )
+        # Each caller gets the results for its own query
+        assert first[0].id == "query one"
+        assert second[0].id == "query two"
+
+    @pytest.mark.asyncio
+    async def test_batches_group_by_speaker_filter(self, batching_tool):
+        """Test that queries with different filters go in separate searches."""
+        async def fake_batch(queries, k=5, alex_only=False):
+            return [[_make_chunk(query)] for query in queries]
+
+        batching_tool.rag_system.batch_similarity_search.side_effect = fake_batch
+
+        await asyncio.gather(
+            batching_tool._search("general", 2),
+            batching_tool._search("alex", 2, alex_only=True)
+        )
+
+        assert batching_tool.rag_system.batch_similarity_search.call_args_list == [
+            call(["general"], k=2, alex_only=False),
+            call(["alex"], k=2, alex_only=True),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_results_trimmed_to_requested_k(self, batching_tool):
+        """Test that a shared search uses the largest k and trims per caller."""
+        async def fake_batch(queries, k=5, alex_only=False):
+            return [[_make_chunk(f"{query}-{i}") for i in range(k)] for query in queries]
+
+        batching_tool.rag_system.batch_similarity_search.side_effect = fake_batch
+
+        small, large = await asyncio.gather(
+            batching_tool._search("small", 1),
+            batching_tool._search("large", 4)
+        )
+
+        batching_tool.rag_system.batch_similarity_search.assert_called_once()
+        assert batching_tool.rag_system.batch_similarity_search.call_args.kwargs["k"] == 4
+        assert len(small) == 1
+        assert len(large) == 4
+
+    @pytest.mark.asyncio
+    async def test_search_error_reaches_every_caller(self, batching_tool):
+        """Test that a failed batch search propagates to all waiting queries."""
+        batching_tool.rag_system.batch_similarity_search.side_effect = RuntimeError("index offline")
+
+        results = await asyncio.gather(
+            batching_tool._search("one", 2),
+            batching_tool._search("two", 2),
+            return_exceptions=True
+        )
+
+        assert len(results) == 2
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestTrivialQueryGate:
+    """Test the filler-query check that skips retrieval."""
+
+    def test_filler_queries_are_trivial(self):
+        """Test that greetings and acknowledgements are flagged as trivial."""
+        filler_queries = [
+            "hi",
+            "Hello!",
+            "thanks",
+            "Thank you.",
+            "  ok  ",
+            "yeah ok"
+        ]
+
+        for query in filler_queries:
+            assert AlexPersonaToolkit._is_trivial(query), f"Expected {query!r} to be trivial"
+
+    def test_real_queries_are_not_trivial(self):
+        """Test that substantive queries pass the gate."""
+        real_queries = [
+            "Tell me about the RAG platform",
+            "hi, how did you scale the team?",
+            "platform",
+            "What metrics did you track?"
+        ]
+
+        for query in real_queries:
+            assert not AlexPersonaToolkit._is_trivial(query), f"Expected {query!r} to be substantive"
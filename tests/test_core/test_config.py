@@ -67,12 +67,17 @@ class TestConfiguration:
 
     @patch('src.core.config.AsyncOpenAI')
     def test_openai_client_creation(self, mock_openai, temp_dir):
-        """Test OpenAI client creation."""
+        """Test OpenAI client creation and reuse."""
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}, clear=True):
             config = Config()
             client = config.get_openai_client()
 
-            mock_openai.assert_called_once_with(api_key="test_key")
+            assert mock_openai.call_count == 1
+            assert mock_openai.call_args.kwargs["api_key"] == "test_key"
+            assert "http_client" in mock_openai.call_args.kwargs
+
+            # Subsequent calls reuse the same client instance
+            assert config.get_openai_client() is client
 
     def test_validate_config_success(self, temp_dir):
         """Test successful configuration validation."""
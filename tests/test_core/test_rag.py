@@ -8,6 +8,7 @@ import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from src.core.models import ConversationChunk, PersonaContext
@@ -20,7 +21,8 @@ class TestConversationRAG:
     @pytest.fixture
     def mock_rag_system(self, mock_openai_client, temp_dir):
         """Create a mock RAG system for testing."""
-        with patch('src.core.rag.config') as mock_config:
+        with patch('src.core.rag.get_config') as mock_get_config:
+            mock_config = mock_get_config.return_value
             mock_config.vector_store_path = temp_dir / "vectors"
             mock_config.conversation_data_path = temp_dir / "convos"
             mock_config.chunk_size = 100
@@ -36,9 +38,9 @@ class TestConversationRAG:
 
         embedding = await mock_rag_system._get_embedding(test_text)
 
-        assert isinstance(embedding, list)
+        assert isinstance(embedding, np.ndarray)
+        assert embedding.dtype == np.float32
         assert len(embedding) == 5  # Based on mock response
-        assert all(isinstance(x, float) for x in embedding)
 
     @pytest.mark.asyncio
     async def test_get_embedding_caching(self, mock_rag_system):
@@ -51,7 +53,7 @@ class TestConversationRAG:
         # Second call should use cache
         embedding2 = await mock_rag_system._get_embedding(test_text)
 
-        assert embedding1 == embedding2
+        assert np.array_equal(embedding1, embedding2)
         # Should only be called once due to caching
         assert mock_rag_system.client.embeddings.create.call_count == 1
 
@@ -130,7 +132,9 @@ class TestConversationRAG:
             )
         ]
 
-        expertise = mock_rag_system._extract_technical_expertise(chunks)
+        expertise = mock_rag_system._extract_technical_expertise(
+            [chunk.content.lower() for chunk in chunks]
+        )
 
         assert isinstance(expertise, list)
         assert any("AI/ML and RAG platforms" in area for area in expertise)
@@ -154,7 +158,9 @@ class TestConversationRAG:
             )
         ]
 
-        patterns = mock_rag_system._extract_decision_patterns(chunks)
+        patterns = mock_rag_system._extract_decision_patterns(
+            [chunk.content.lower() for chunk in chunks]
+        )
 
         assert isinstance(patterns, list)
         assert any("data-driven" in pattern.lower() for pattern in patterns)
@@ -177,7 +183,9 @@ class TestConversationRAG:
             )
         ]
 
-        traits = mock_rag_system._extract_personality_traits(chunks)
+        traits = mock_rag_system._extract_personality_traits(
+            [chunk.content.lower() for chunk in chunks]
+        )
 
         assert isinstance(traits, list)
         assert any("detail-oriented" in trait.lower() for trait in traits)
@@ -193,12 +201,42 @@ class TestConversationRAG:
         # Create the files
         mock_rag_system.vector_store_path.mkdir(exist_ok=True)
         (mock_rag_system.vector_store_path / "index.faiss").touch()
-        (mock_rag_system.vector_store_path / "chunks.pkl").touch()
+        (mock_rag_system.vector_store_path / "chunks_meta.json").touch()
+        (mock_rag_system.vector_store_path / "embeddings.npy").touch()
 
         # Test when files exist
         assert mock_rag_system._vector_store_exists()
 
 
+class TestEmbeddingDiskCache:
+    """Test the persistent on-disk embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_round_trip(self, mock_openai_client, temp_dir):
+        """Test that a fresh instance serves embeddings from the sqlite cache."""
+        with patch('src.core.rag.get_config') as mock_get_config:
+            mock_config = mock_get_config.return_value
+            mock_config.vector_store_path = temp_dir / "vectors"
+            mock_config.conversation_data_path = temp_dir / "convos"
+            mock_config.vector_store_path.mkdir()
+
+            first = ConversationRAG(mock_openai_client)
+            original = await first._get_embedding("persistent cache test")
+            first._embedding_db.commit()
+
+            # A second instance simulates a restart sharing the same store
+            second = ConversationRAG(mock_openai_client)
+            restored = await second._get_embedding("persistent cache test")
+
+        # Only the first instance should have called the API
+        assert mock_openai_client.embeddings.create.call_count == 1
+        assert np.array_equal(restored, original)
+        assert restored.dtype == np.float32
+        # Callers normalize embeddings in place, so rows loaded from disk
+        # must come back as writable arrays
+        assert restored.flags.writeable
+
+
 class TestRAGIntegration:
     """Test RAG system integration scenarios."""
 
@@ -213,7 +251,8 @@ class TestRAGIntegration:
         dest_file = conversation_dir / "sample.md"
         dest_file.write_text(sample_conversation_file.read_text())
 
-        with patch('src.core.rag.config') as mock_config:
+        with patch('src.core.rag.get_config') as mock_get_config:
+            mock_config = mock_get_config.return_value
             mock_config.vector_store_path = temp_dir / "vectors"
             mock_config.conversation_data_path = conversation_dir
             mock_config.chunk_size = 100
@@ -240,7 +279,8 @@ class TestRAGIntegration:
     @pytest.mark.asyncio
     async def test_similarity_search_with_mock_index(self, temp_dir, mock_openai_client):
         """Test similarity search with mocked FAISS index."""
-        with patch('src.core.rag.config') as mock_config:
+        with patch('src.core.rag.get_config') as mock_get_config:
+            mock_config = mock_get_config.return_value
             mock_config.vector_store_path = temp_dir / "vectors"
             mock_config.conversation_data_path = temp_dir / "convos"
 
@@ -265,7 +305,6 @@ class TestRAGIntegration:
                     file_source="test.md"
                 )
             ]
-            rag.chunk_map = {0: rag.chunks[0], 1: rag.chunks[1]}
 
             results = await rag.similarity_search("test query", k=2)
 